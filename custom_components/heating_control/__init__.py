@@ -143,6 +143,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    entry.async_on_unload(coordinator.async_track_presence_entities())
+    entry.async_on_unload(coordinator.async_track_schedule_edges())
 
     # Auto-create dashboard if it doesn't exist
     await _async_setup_dashboard(hass, entry)
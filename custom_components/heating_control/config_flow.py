@@ -31,6 +31,7 @@ from .const import (
     CONF_SCHEDULE_ID,
     CONF_SCHEDULE_NAME,
     CONF_SCHEDULE_ONLY_WHEN_HOME,
+    CONF_SCHEDULE_OVERRIDES,
     CONF_SCHEDULE_START,
     CONF_SCHEDULE_TEMP_CONDITION,
     CONF_SCHEDULE_TEMPERATURE,
@@ -50,6 +51,7 @@ from .const import (
     TEMPERATURE_MIN,
     TEMPERATURE_STEP,
 )
+from .helpers import schedule_key
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +65,29 @@ def _extract_trackers(config: dict[str, Any] | None) -> list[str]:
     return list(trackers)
 
 
+def _apply_schedule_overrides(config: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the configured schedules with toggle overrides folded in.
+
+    Schedule switches persist their state in ``CONF_SCHEDULE_OVERRIDES``
+    rather than rewriting the schedules list. The options flow saves a fresh
+    schedules list without the override map, so fold the overrides back into
+    each schedule's enabled flag before editing.
+    """
+    schedules = list(config.get(CONF_SCHEDULES, []))
+    overrides = config.get(CONF_SCHEDULE_OVERRIDES) or {}
+    if not overrides:
+        return schedules
+
+    for index, schedule in enumerate(schedules):
+        key = schedule_key(schedule, index)
+        if key in overrides:
+            schedules[index] = {
+                **schedule,
+                CONF_SCHEDULE_ENABLED: overrides[key],
+            }
+    return schedules
+
+
 def _is_duplicate_schedule_name(
     name: str,
     schedules: list[dict[str, Any]],
@@ -157,26 +182,29 @@ def _apply_away_settings(
 def _detect_schedule_overlaps(schedules: list[dict[str, Any]]) -> list[str]:
     """Detect overlapping schedules for the same devices.
 
+    Only schedules that start at the same time can conflict, so schedules are
+    bucketed by start time first and compared pairwise within each bucket.
+
     Returns a list of warning messages about overlapping schedules.
     """
+    by_start: dict[str, list[tuple[str, set[str]]]] = {}
+    for i, schedule in enumerate(schedules):
+        by_start.setdefault(schedule.get(CONF_SCHEDULE_START, "00:00"), []).append(
+            (
+                schedule.get(CONF_SCHEDULE_NAME, f"Schedule {i+1}"),
+                set(schedule.get(CONF_SCHEDULE_DEVICES, [])),
+            )
+        )
+
     warnings = []
-    for i, schedule_a in enumerate(schedules):
-        devices_a = set(schedule_a.get(CONF_SCHEDULE_DEVICES, []))
-        start_a = schedule_a.get(CONF_SCHEDULE_START, "00:00")
-        name_a = schedule_a.get(CONF_SCHEDULE_NAME, f"Schedule {i+1}")
-
-        for j, schedule_b in enumerate(schedules[i+1:], start=i+1):
-            devices_b = set(schedule_b.get(CONF_SCHEDULE_DEVICES, []))
-            common_devices = devices_a & devices_b
-
-            if common_devices:
-                start_b = schedule_b.get(CONF_SCHEDULE_START, "00:00")
-                name_b = schedule_b.get(CONF_SCHEDULE_NAME, f"Schedule {j+1}")
-                # Check if they have the same start time (definite conflict)
-                if start_a == start_b:
+    for start, group in by_start.items():
+        for index, (name_a, devices_a) in enumerate(group):
+            for name_b, devices_b in group[index + 1:]:
+                common_devices = devices_a & devices_b
+                if common_devices:
                     device_list = ", ".join(d.replace("climate.", "") for d in common_devices)
                     warnings.append(
-                        f"⚠️ '{name_a}' and '{name_b}' start at the same time ({start_a}) "
+                        f"⚠️ '{name_a}' and '{name_b}' start at the same time ({start}) "
                         f"for: {device_list}"
                     )
     return warnings
@@ -614,7 +642,7 @@ class HeatingControlOptionsFlow(config_entries.OptionsFlow):
         current_config = self.config_entry.options or self.config_entry.data
 
         if not self._pending_schedules:
-            self._pending_schedules = list(current_config.get(CONF_SCHEDULES, []))
+            self._pending_schedules = _apply_schedule_overrides(current_config)
 
         if user_input is not None:
             action = user_input.get("action")
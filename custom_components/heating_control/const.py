@@ -25,6 +25,7 @@ __all__ = [
     "CONF_SCHEDULE_TEMPERATURE",
     "CONF_SCHEDULE_FAN_MODE",
     "CONF_SCHEDULE_TEMP_CONDITION",
+    "CONF_SCHEDULE_OVERRIDES",
     "CONF_CLIMATE_DEVICES",
     # Per-device off temperature
     "CONF_DEVICE_OFF_TEMPERATURES",
@@ -51,6 +52,8 @@ __all__ = [
     # Settle delays
     "DEFAULT_SETTLE_SECONDS",
     "DEFAULT_FINAL_SETTLE",
+    "SETTLE_MIN_SECONDS",
+    "SETTLE_POLL_INTERVAL",
     # Timeout values
     "SERVICE_CALL_TIMEOUT",
     "UPDATE_CYCLE_TIMEOUT",
@@ -62,6 +65,7 @@ __all__ = [
     "SENSOR_DECISION_DIAGNOSTICS",
     # Update interval
     "UPDATE_INTERVAL",
+    "REQUEST_REFRESH_COOLDOWN",
     # Services
     "SERVICE_SET_SCHEDULE_ENABLED",
     "SERVICE_SET_DEVICE_ENABLED",
@@ -117,6 +121,9 @@ CONF_SCHEDULE_DEVICES = "device_entities"
 CONF_SCHEDULE_TEMPERATURE = "temperature"
 CONF_SCHEDULE_FAN_MODE = "fan_mode"
 CONF_SCHEDULE_TEMP_CONDITION = "temp_condition"
+# Enabled-state overrides written by schedule toggles, keyed by schedule ID.
+# Lets a toggle persist a single flag instead of rewriting the schedules list.
+CONF_SCHEDULE_OVERRIDES = "schedule_enabled_overrides"
 
 # Configuration keys - Climate devices (just a list of available entities)
 CONF_CLIMATE_DEVICES = "climate_devices"
@@ -173,6 +180,10 @@ AWAY_HVAC_MODE_OPTIONS = [{"label": "Use home HVAC mode", "value": "inherit"}] +
 # Some devices need time to stabilize after mode changes before accepting temperature commands
 DEFAULT_SETTLE_SECONDS = 5  # Wait after HVAC mode change before sending temperature
 DEFAULT_FINAL_SETTLE = 2  # Final wait after all commands to ensure device stability
+# The settle wait after set_hvac_mode ends early once the device reports the new
+# mode, but never before SETTLE_MIN_SECONDS (some integrations report optimistically)
+SETTLE_MIN_SECONDS = 1
+SETTLE_POLL_INTERVAL = 0.5
 
 # Timeout values (seconds)
 # Maximum time for a single climate service call
@@ -203,9 +214,13 @@ BINARY_SENSOR_PRESENCE = "presence"
 SENSOR_DECISION_DIAGNOSTICS = "decision_diagnostics"
 
 # Update interval (seconds)
-# How often the coordinator checks schedules and evaluates state transitions
-# 60 seconds provides responsive updates without excessive polling
-UPDATE_INTERVAL = 60
+# Safety-net poll: schedule edges and tracker/outdoor sensor changes trigger
+# their own refreshes. Must stay below WATCHDOG_STUCK_THRESHOLD.
+UPDATE_INTERVAL = 120
+
+# Minimum spacing between requested refreshes (seconds)
+# Requests within this window (e.g. several toggles) are coalesced into one refresh
+REQUEST_REFRESH_COOLDOWN = 1.0
 
 # Services
 SERVICE_SET_SCHEDULE_ENABLED = "set_schedule_enabled"
@@ -4,7 +4,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Dict, Iterable, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
 
 __all__ = ["ClimateController"]
 
@@ -12,7 +12,12 @@ from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, ServiceNotFound
 
-from .const import SERVICE_CALL_TIMEOUT, TEMPERATURE_EPSILON
+from .const import (
+    SERVICE_CALL_TIMEOUT,
+    SETTLE_MIN_SECONDS,
+    SETTLE_POLL_INTERVAL,
+    TEMPERATURE_EPSILON,
+)
 from .models import DeviceDecision
 
 _LOGGER = logging.getLogger(__name__)
@@ -45,6 +50,8 @@ class ClimateController:
         self._history: Dict[str, _DeviceCommandState] = {}
         self._timed_out_devices: set[str] = set()  # Use set to prevent duplicates
         self._force_refresh_devices: set[str] = set()  # Devices that need history ignored
+        # Per-device fan_modes attribute and its frozenset, rebuilt when the attribute changes
+        self._fan_modes_cache: Dict[str, Tuple[Any, FrozenSet[str]]] = {}
 
     def clear_history(self) -> None:
         """Clear command history for all devices.
@@ -89,9 +96,18 @@ class ClimateController:
         for device_id in orphaned_devices:
             del self._history[device_id]
             _LOGGER.debug("Cleaned up history for removed device: %s", device_id)
+        for device_id in self._fan_modes_cache.keys() - current_devices:
+            del self._fan_modes_cache[device_id]
 
-        for decision in decisions_list:
-            await self._apply_device(decision)
+        # Devices are independent, so their settle delays overlap instead of adding up
+        results = await asyncio.gather(
+            *(self._apply_device(decision) for decision in decisions_list),
+            return_exceptions=True,
+        )
+        for result in results:
+            # _apply_device already logged it; let other devices finish first
+            if isinstance(result, BaseException):
+                raise result
         return list(self._timed_out_devices)
 
     async def _send_climate_command(
@@ -131,6 +147,45 @@ class ClimateController:
             self._timed_out_devices.add(entity_id)
             return False
 
+    def _supported_fan_modes(
+        self, entity_id: str, attributes: Dict[str, Any]
+    ) -> FrozenSet[str]:
+        """Return the device's fan modes as a frozenset, reused while the attribute is unchanged."""
+        fan_modes = attributes.get("fan_modes")
+        cached = self._fan_modes_cache.get(entity_id)
+        if cached is not None and cached[0] is fan_modes:
+            return cached[1]
+        supported = frozenset(fan_modes or ())
+        self._fan_modes_cache[entity_id] = (fan_modes, supported)
+        return supported
+
+    async def _wait_for_hvac_mode(
+        self,
+        entity_id: str,
+        hvac_mode: str,
+        timeout: float,
+    ) -> None:
+        """Wait until the device reports ``hvac_mode``, for at most ``timeout`` seconds.
+
+        Always waits at least SETTLE_MIN_SECONDS, since integrations that update
+        state optimistically report the new mode before the device has applied it.
+        After that the state machine is polled, so devices that acknowledge
+        quickly are not held up for the full settle time.
+        """
+        minimum = min(SETTLE_MIN_SECONDS, timeout)
+        await asyncio.sleep(minimum)
+        remaining = timeout - minimum
+        while remaining > 0:
+            state = self._hass.states.get(entity_id)
+            if state is not None and state.state == hvac_mode:
+                return
+            interval = min(SETTLE_POLL_INTERVAL, remaining)
+            await asyncio.sleep(interval)
+            remaining -= interval
+        _LOGGER.debug(
+            "%s did not report HVAC mode %s within %ss", entity_id, hvac_mode, timeout
+        )
+
     async def _apply_device(self, decision: DeviceDecision) -> None:
         """Apply commands for a single climate device."""
         entity_id = decision.entity_id
@@ -195,8 +250,36 @@ class ClimateController:
             and previous_fan != target_fan
         )
 
+        # Skip commands the device already reflects, e.g. after history was cleared
+        attributes = state.attributes
+        already_applied = False
+        if state_changed and state.state == effective_hvac_mode:
+            state_changed = False
+            already_applied = True
+        if temp_changed:
+            current_temp = attributes.get("temperature")
+            if (
+                isinstance(current_temp, (int, float))
+                and abs(current_temp - effective_temp) <= TEMPERATURE_EPSILON
+            ):
+                temp_changed = False
+                already_applied = True
+        if fan_changed and attributes.get("fan_mode") == target_fan:
+            fan_changed = False
+            already_applied = True
+
         if not state_changed and not temp_changed and not fan_changed:
             _LOGGER.debug("No changes required for %s", entity_id)
+            if already_applied:
+                # Remember the device's values so later cycles short-circuit on history
+                self._update_device_history(
+                    entity_id,
+                    effective_hvac_mode,
+                    effective_temp,
+                    target_fan,
+                    should_be_on or use_off_temperature,
+                )
+                self._update_force_refresh_status(entity_id, True, True, True)
             return
 
         # Track which operations succeeded for history updates
@@ -221,7 +304,9 @@ class ClimateController:
                     log_msg,
                 )
                 if hvac_mode_succeeded:
-                    await asyncio.sleep(self._settle_seconds)
+                    await self._wait_for_hvac_mode(
+                        entity_id, effective_hvac_mode, self._settle_seconds
+                    )
 
             # --- Temperature ---
             if temp_changed and (should_be_on or use_off_temperature):
@@ -242,8 +327,7 @@ class ClimateController:
 
             # --- Fan mode ---
             if fan_changed:
-                fan_modes = state.attributes.get("fan_modes", [])
-                if fan_modes and target_fan in fan_modes:
+                if target_fan in self._supported_fan_modes(entity_id, attributes):
                     fan_succeeded = await self._send_climate_command(
                         entity_id,
                         "set_fan_mode",
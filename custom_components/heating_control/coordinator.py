@@ -2,16 +2,20 @@
 from __future__ import annotations
 
 import asyncio
-from copy import deepcopy
+from bisect import bisect_right
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
+from functools import lru_cache
 import logging
 import time
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Set, Tuple
 
 __all__ = ["HeatingControlCoordinator"]
 
 from homeassistant.const import STATE_HOME, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant, State
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
@@ -31,6 +35,7 @@ from .const import (
     CONF_SCHEDULE_ID,
     CONF_SCHEDULE_NAME,
     CONF_SCHEDULE_ONLY_WHEN_HOME,
+    CONF_SCHEDULE_OVERRIDES,
     CONF_SCHEDULE_HVAC_MODE,
     CONF_SCHEDULE_AWAY_HVAC_MODE,
     CONF_SCHEDULE_AWAY_TEMPERATURE,
@@ -47,6 +52,7 @@ from .const import (
     DEFAULT_SCHEDULE_TEMPERATURE,
     DEFAULT_SETTLE_SECONDS,
     DOMAIN,
+    REQUEST_REFRESH_COOLDOWN,
     TEMP_CONDITION_ALWAYS,
     TEMP_CONDITION_COLD,
     TEMP_CONDITION_WARM,
@@ -55,13 +61,30 @@ from .const import (
     WATCHDOG_STUCK_THRESHOLD,
 )
 from .controller import ClimateController
+from .helpers import schedule_key
 from .models import DeviceDecision, DiagnosticsSnapshot, HeatingStateSnapshot, ScheduleDecision
 
 _LOGGER = logging.getLogger(__name__)
 
 MINUTES_PER_DAY = 24 * 60
 
-HVAC_MODES_WITH_TEMPERATURE = {"heat", "cool", "heat_cool", "auto"}
+HVAC_MODES_WITH_TEMPERATURE = frozenset({"heat", "cool", "heat_cool", "auto"})
+
+# HVAC modes that leave the device off
+_OFF_MODES = frozenset({None, "off"})
+
+# Result of _classify_mode: which targets an effective HVAC mode carries
+_MODE_OFF = 0
+_MODE_NO_TEMP = 1
+_MODE_TEMP = 2
+
+# Positions in HeatingControlCoordinator._schedule_index
+_INDEX_BY_ID = 0
+_INDEX_BY_NAME = 1
+_INDEX_BY_NAME_WITHOUT_ID = 2
+
+# Entity states that carry no usable reading (trackers and sensors)
+_UNUSABLE_STATES = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE})
 
 
 def _mode_supports_temperature(mode: Optional[str]) -> bool:
@@ -71,6 +94,47 @@ def _mode_supports_temperature(mode: Optional[str]) -> bool:
     return mode in HVAC_MODES_WITH_TEMPERATURE
 
 
+def _classify_mode(mode: Optional[str]) -> int:
+    """Classify an HVAC mode as off, fan-only, or temperature-controlled."""
+    if mode in _OFF_MODES:
+        return _MODE_OFF
+    if mode in HVAC_MODES_WITH_TEMPERATURE:
+        return _MODE_TEMP
+    return _MODE_NO_TEMP
+
+
+@lru_cache(maxsize=512)
+def _parse_hhmm_cached(time_str: str) -> int:
+    """Parse an HH:MM string to minutes since midnight, raising ValueError if invalid.
+
+    Schedules only ever use a handful of distinct time strings, so results are
+    memoized and each update cycle reuses them instead of re-parsing.
+    """
+    # Fast path for the canonical zero-padded "HH:MM" form: slice instead of split
+    if len(time_str) == 5 and time_str[2] == ':':
+        try:
+            hours, minutes = int(time_str[0:2]), int(time_str[3:5])
+        except ValueError:
+            pass
+        else:
+            if 0 <= hours < 24 and 0 <= minutes < 60:
+                return hours * 60 + minutes
+
+    if ':' not in time_str:
+        raise ValueError(f"Invalid time format: {time_str}")
+
+    parts = time_str.split(':')
+    if len(parts) != 2:
+        raise ValueError(f"Time must be HH:MM format: {time_str}")
+
+    hours, minutes = int(parts[0]), int(parts[1])
+
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f"Time out of range: {time_str}")
+
+    return hours * 60 + minutes
+
+
 def _parse_time_to_minutes(time_str: str, logger: logging.Logger) -> int:
     """Parse HH:MM time string to minutes since midnight with validation.
 
@@ -90,24 +154,87 @@ def _parse_time_to_minutes(time_str: str, logger: logging.Logger) -> int:
         0  # Logs warning and returns default
     """
     try:
-        if not isinstance(time_str, str) or ':' not in time_str:
+        if not isinstance(time_str, str):
             raise ValueError(f"Invalid time format: {time_str}")
 
-        parts = time_str.split(':')
-        if len(parts) != 2:
-            raise ValueError(f"Time must be HH:MM format: {time_str}")
+        return _parse_hhmm_cached(time_str)
 
-        hours, minutes = int(parts[0]), int(parts[1])
+    except ValueError as err:
+        logger.warning("Invalid time '%s': %s, defaulting to 00:00", time_str, err)
+        return 0
 
-        if not (0 <= hours < 24 and 0 <= minutes < 60):
-            raise ValueError(f"Time out of range: {time_str}")
 
-        total_minutes = hours * 60 + minutes
-        return total_minutes
+def _is_schedule_enabled(
+    schedule: Dict[str, Any],
+    schedule_key: str,
+    enabled_overrides: Optional[Mapping[str, bool]],
+) -> bool:
+    """Return the effective enabled state, preferring a persisted toggle override."""
+    if enabled_overrides and schedule_key in enabled_overrides:
+        return bool(enabled_overrides[schedule_key])
+    return schedule.get(CONF_SCHEDULE_ENABLED, True)
+
+
+def _classify_outdoor_temp(
+    outdoor_temp: float, threshold: float, previous_state: Optional[str]
+) -> str:
+    """Return 'cold' or 'warm' using Schmitt trigger logic with hysteresis."""
+    if previous_state == "cold":
+        # Currently cold: only switch to warm if temp >= threshold + hysteresis
+        if outdoor_temp >= threshold + DEFAULT_OUTDOOR_TEMP_HYSTERESIS:
+            return "warm"
+        return "cold"
+    # First run or currently warm: simple threshold comparison
+    return "cold" if outdoor_temp < threshold else "warm"
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedSchedule:
+    """Schedule configuration parsed once per config entry update.
+
+    Everything here depends only on the config entry, so it is computed when the
+    config changes instead of on every update cycle.
+    """
 
-    except (ValueError, AttributeError) as err:
-        logger.warning("Invalid time '%s': %s, defaulting to 00:00", time_str, err)
-        return 0
+    order: int
+    schedule_id: str
+    config_id: Optional[str]
+    name: str
+    name_casefold: str
+    enabled: bool
+    start_time: str
+    end_time: str
+    start_minutes: int
+    end_minutes: int
+    only_when_home: bool
+    schedule_trackers: Tuple[str, ...]
+    valid_trackers: Tuple[str, ...]
+    hvac_mode_home: str
+    hvac_mode_away: Optional[str]
+    home_supports_temp: bool
+    away_supports_temp: bool
+    devices: Tuple[str, ...]
+    temp_home: float
+    temp_away: Optional[float]
+    fan_mode: Optional[str]
+    temp_condition: str
+
+
+class _ScheduleEntryBuilder(NamedTuple):
+    """An active schedule's targets for one device, ranked by ``sort_key``."""
+
+    schedule_name: str
+    schedule_id: str
+    order: int
+    start_minutes: int
+    start_age: int
+    start_time: str
+    end_time: Optional[str]
+    hvac_mode: Optional[str]
+    temperature: Optional[float]
+    fan_mode: Optional[str]
+    # Most recent start wins; later config order breaks ties
+    sort_key: Tuple[int, int]
 
 
 class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
@@ -137,11 +264,38 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         self._previous_outdoor_temp_state: Optional[str] = None
         self._force_update = False
 
+        # Last calculated snapshot and the inputs it was calculated from
+        self._last_calc_key: Optional[Tuple[Any, ...]] = None
+        self._last_calc_snapshot: Optional[HeatingStateSnapshot] = None
+
         # Counter for "soft updates" in progress (schedule/device toggles).
         # When > 0, the config entry update listener should skip full reload.
         # Using a counter instead of boolean to handle concurrent rapid toggles.
+        # Each toggle holds it until a queued refresh has applied the change.
         self._soft_update_count = 0
 
+        # Refreshes queued by toggles, tracker changes and schedule edges: the flag is set per request and cleared
+        # just before a refresh reads state, so a request that arrives while
+        # one is running triggers exactly one more run once it completes
+        self._refresh_requested = False
+        self._queued_refresh: Optional[asyncio.Task] = None
+
+        # Config-derived data cached until the config entry mapping is replaced
+        self._derived_config_source: Optional[Mapping[str, Any]] = None
+        self._prepared_schedules: Tuple[_PreparedSchedule, ...] = ()
+        # First schedule index per configured ID, casefolded name, and
+        # casefolded name among schedules without an ID
+        self._schedule_index: Tuple[Dict[str, int], Dict[str, int], Dict[str, int]] = ({}, {}, {})
+        # Deduplicated global trackers, and those plus every per-schedule tracker
+        self._global_trackers: Tuple[str, ...] = ()
+        self._presence_entities: Tuple[str, ...] = ()
+        # Sorted start/end minutes of enabled schedules
+        self._schedule_edges: Tuple[int, ...] = ()
+
+        # Timer that refreshes at the next schedule edge, while edges are tracked
+        self._track_schedule_edges = False
+        self._unsub_edge_refresh: Optional[CALLBACK_TYPE] = None
+
         # Watchdog state tracking
         self._last_update_start: Optional[float] = None
         self._last_update_complete: Optional[float] = None
@@ -154,6 +308,14 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            # Bursts of entity update requests share one refresh, without the
+            # default 10s cooldown delaying follow-up requests
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=True,
+            ),
         )
 
     @property
@@ -166,6 +328,99 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         """
         return self.config_entry.options or self.config_entry.data
 
+    def _get_presence_entities(self) -> frozenset[str]:
+        """Return every global and per-schedule tracker that influences presence."""
+        self._get_prepared_schedules(self.config)
+        return frozenset(self._presence_entities)
+
+    @callback
+    def async_track_presence_entities(self) -> CALLBACK_TYPE:
+        """Refresh as soon as a presence tracker or the outdoor sensor changes state.
+
+        Subscribes only to the configured entities, so Home Assistant dispatches
+        by entity_id instead of waking us for every state change. Returns the
+        unsubscribe callback.
+        """
+        entities = set(self._get_presence_entities())
+        outdoor_sensor = self.config.get(CONF_OUTDOOR_TEMP_SENSOR)
+        if outdoor_sensor:
+            entities.add(outdoor_sensor)
+        if not entities:
+            return lambda: None
+        return async_track_state_change_event(
+            self.hass, list(entities), self._handle_presence_change
+        )
+
+    @callback
+    def _handle_presence_change(self, event: Event) -> None:
+        """Request a refresh when a tracker's state (not just attributes) changes.
+
+        Outdoor sensor readings only matter when they flip the cold/warm state.
+        """
+        old_state: Optional[State] = event.data.get("old_state")
+        new_state: Optional[State] = event.data.get("new_state")
+        if old_state is not None and new_state is not None and old_state.state == new_state.state:
+            return
+        config = self.config
+        outdoor_sensor = config.get(CONF_OUTDOOR_TEMP_SENSOR)
+        if (
+            outdoor_sensor
+            and event.data.get("entity_id") == outdoor_sensor
+            and self._outdoor_reading_state(config, new_state) == self._previous_outdoor_temp_state
+        ):
+            return
+        # Several trackers often change together (e.g. everyone leaves); they
+        # share one queued refresh, and a change landing after a running
+        # refresh has read the trackers makes it run once more.
+        self._async_queue_refresh()
+
+    @callback
+    def async_track_schedule_edges(self) -> CALLBACK_TYPE:
+        """Refresh at each schedule start/end minute instead of waiting for the next poll.
+
+        The timer is re-armed after every update. Returns a callback that stops it.
+        """
+        self._track_schedule_edges = True
+        self._schedule_next_edge_refresh()
+
+        @callback
+        def _stop() -> None:
+            self._track_schedule_edges = False
+            if self._unsub_edge_refresh is not None:
+                self._unsub_edge_refresh()
+                self._unsub_edge_refresh = None
+
+        return _stop
+
+    @callback
+    def _schedule_next_edge_refresh(self) -> None:
+        """Arm a one-shot refresh for the next schedule start or end minute."""
+        if self._unsub_edge_refresh is not None:
+            self._unsub_edge_refresh()
+            self._unsub_edge_refresh = None
+
+        self._get_prepared_schedules(self.config)
+        edges = self._schedule_edges
+        if not edges:
+            return
+
+        now = datetime.now()
+        now_minutes = now.hour * 60 + now.minute
+        index = bisect_right(edges, now_minutes)
+        next_edge = edges[index] if index < len(edges) else edges[0] + MINUTES_PER_DAY
+        delay = (next_edge - now_minutes) * 60 - now.second - now.microsecond / 1_000_000
+        self._unsub_edge_refresh = async_call_later(
+            self.hass, delay, self._handle_schedule_edge
+        )
+
+    @callback
+    def _handle_schedule_edge(self, _now: datetime) -> None:
+        """Refresh when a schedule starts or ends."""
+        self._unsub_edge_refresh = None
+        # Queued rather than debounced, so an edge during a running refresh
+        # is not dropped until the next poll
+        self._async_queue_refresh()
+
     def refresh_controller_config(self) -> None:
         """Refresh controller configuration from current config.
 
@@ -183,27 +438,49 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         Returns:
             Schedule configuration dict, or None if not found
         """
-        schedules = self.config.get(CONF_SCHEDULES, [])
-        schedule_id_lower = schedule_id.casefold()
+        config = self.config
+        # Match by ID, or by name (case-insensitive); earliest schedule wins
+        index = self._find_schedule_index(
+            config,
+            (_INDEX_BY_ID, schedule_id),
+            (_INDEX_BY_NAME, schedule_id.casefold()),
+        )
+        return None if index is None else config[CONF_SCHEDULES][index]
 
-        for schedule in schedules:
-            # Match by ID first
-            if schedule.get(CONF_SCHEDULE_ID) == schedule_id:
-                return schedule
-            # Fall back to name match (case-insensitive)
-            if schedule.get(CONF_SCHEDULE_NAME, "").casefold() == schedule_id_lower:
-                return schedule
+    def get_schedule_enabled(
+        self, schedule_id: str, fallback_name: Optional[str] = None
+    ) -> Optional[bool]:
+        """Get a schedule's enabled state, including persisted toggle overrides.
 
-        return None
+        Args:
+            schedule_id: Schedule ID or name to look up
+            fallback_name: Name to match (case-insensitive) if the ID finds nothing
+
+        Returns:
+            Whether the schedule is enabled, or None if not found
+        """
+        config = self.config
+        index = self._find_schedule_index(
+            config,
+            (_INDEX_BY_ID, schedule_id),
+            (_INDEX_BY_NAME, schedule_id.casefold()),
+        )
+        if index is None and fallback_name:
+            index = self._find_schedule_index(
+                config, (_INDEX_BY_NAME, fallback_name.casefold())
+            )
+        return None if index is None else self._prepared_schedules[index].enabled
 
     async def _async_update_data(self) -> HeatingStateSnapshot:
         """Update data and apply control decisions with watchdog protection.
 
         NOTE: Timing variables (_last_update_start, _last_update_complete, _last_update_duration)
         are accessed without locks because DataUpdateCoordinator guarantees serial execution
-        of update cycles. Only one instance of this method runs at a time.
+        of update cycles. Only one instance of this method runs at a time, always on the
+        event loop, so no threading primitive is needed. They use perf_counter (monotonic)
+        so wall-clock adjustments (NTP, DST) cannot skew durations or trip the stuck check.
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self._last_update_start = start_time
 
         # Check if previous update is stuck
@@ -221,7 +498,7 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
                 snapshot = await self._async_update_data_internal()
 
             # Update timing
-            end_time = time.time()
+            end_time = time.perf_counter()
             self._last_update_complete = end_time
             self._last_update_duration = end_time - start_time
 
@@ -232,7 +509,7 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
             return snapshot
 
         except asyncio.TimeoutError as err:
-            end_time = time.time()
+            end_time = time.perf_counter()
             self._last_update_complete = end_time
             self._last_update_duration = end_time - start_time
             self._update_cycle_timed_out = True
@@ -241,16 +518,20 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
             ) from err
 
         except Exception as err:
-            end_time = time.time()
+            end_time = time.perf_counter()
             self._last_update_complete = end_time
             self._last_update_duration = end_time - start_time
+            # UpdateFailed is logged without a traceback; log the original error in full
+            _LOGGER.exception("Unexpected error updating heating control")
             raise UpdateFailed(f"Error updating heating control: {err}") from err
 
     async def _async_update_data_internal(self) -> HeatingStateSnapshot:
         """Internal update logic without timeout wrapper."""
-        snapshot = await self.hass.async_add_executor_job(
-            self._calculate_heating_state
-        )
+        # Pure in-memory computation over hass.states: run it on the event loop,
+        # where the state machine is written, instead of paying for an executor hop.
+        snapshot = self._calculate_heating_state()
+        if self._track_schedule_edges:
+            self._schedule_next_edge_refresh()
 
         should_apply_control, should_reset_history = self._detect_state_transitions(snapshot)
 
@@ -261,9 +542,15 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
                 # require resetting controller history to override manual user changes.
                 # This ensures the system takes back control when state changes.
                 self._controller.clear_history()
-            timed_out_devices = await self._controller.async_apply(
-                snapshot.device_decisions.values()
-            )
+            try:
+                timed_out_devices = await self._controller.async_apply(
+                    snapshot.device_decisions.values()
+                )
+            except Exception:  # Unexpected errors; the snapshot itself is still valid
+                _LOGGER.exception("Unexpected error applying control decisions")
+                # Retry on the next cycle; failed devices are already marked for refresh
+                self._force_update = True
+                timed_out_devices = []
             self._timed_out_devices = set(timed_out_devices)
 
             if timed_out_devices:
@@ -472,32 +759,163 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         if self._timed_out_devices or self._update_cycle_timed_out:
             watchdog_status = "timeout"  # Timeout overrides all other statuses
 
-        # Create enriched diagnostics
-        enriched_diagnostics = DiagnosticsSnapshot(
-            now_time=snapshot.diagnostics.now_time,
-            tracker_states=snapshot.diagnostics.tracker_states,
-            trackers_home=snapshot.diagnostics.trackers_home,
-            trackers_total=snapshot.diagnostics.trackers_total,
-            auto_heating_enabled=snapshot.diagnostics.auto_heating_enabled,
-            schedule_count=snapshot.diagnostics.schedule_count,
-            active_schedules=snapshot.diagnostics.active_schedules,
-            active_devices=snapshot.diagnostics.active_devices,
-            last_update_duration=self._last_update_duration,
-            timed_out_devices=tuple(self._timed_out_devices),
-            watchdog_status=watchdog_status,
+        # The duration differs on every cycle, so always copy; only the
+        # watchdog fields change, everything else is shared as-is
+        return replace(
+            snapshot,
+            diagnostics=replace(
+                snapshot.diagnostics,
+                last_update_duration=self._last_update_duration,
+                timed_out_devices=tuple(self._timed_out_devices),
+                watchdog_status=watchdog_status,
+            ),
         )
 
-        # Return new snapshot with enriched diagnostics
-        return HeatingStateSnapshot(
-            everyone_away=snapshot.everyone_away,
-            anyone_home=snapshot.anyone_home,
-            schedule_decisions=snapshot.schedule_decisions,
-            device_decisions=snapshot.device_decisions,
-            diagnostics=enriched_diagnostics,
-        )
+    def _get_prepared_schedules(
+        self, config: Mapping[str, Any]
+    ) -> Tuple[_PreparedSchedule, ...]:
+        """Return parsed schedules, re-parsing only when the config changes.
+
+        Home Assistant replaces the options/data mapping on every config entry
+        update (including soft toggles), so mapping identity is a reliable key.
+        """
+        if self._derived_config_source is not config:
+            self._prepared_schedules = self._prepare_schedules(config)
+            self._schedule_index = self._build_schedule_index(self._prepared_schedules)
+            # dict.fromkeys keeps first-seen order while dropping duplicates
+            global_trackers = dict.fromkeys(
+                tracker for tracker in config.get(CONF_DEVICE_TRACKERS, []) if tracker
+            )
+            self._global_trackers = tuple(global_trackers)
+            for prepared in self._prepared_schedules:
+                global_trackers.update(dict.fromkeys(prepared.valid_trackers))
+            self._presence_entities = tuple(global_trackers)
+            edges = set()
+            for prepared in self._prepared_schedules:
+                if prepared.enabled:
+                    edges.add(prepared.start_minutes)
+                    edges.add(prepared.end_minutes)
+            self._schedule_edges = tuple(sorted(edges))
+            self._derived_config_source = config
+        return self._prepared_schedules
+
+    @staticmethod
+    def _build_schedule_index(
+        prepared_schedules: Tuple[_PreparedSchedule, ...],
+    ) -> Tuple[Dict[str, int], Dict[str, int], Dict[str, int]]:
+        """Index schedules for O(1) lookup, keeping the first match like a linear scan."""
+        by_id: Dict[str, int] = {}
+        by_name: Dict[str, int] = {}
+        by_name_without_id: Dict[str, int] = {}
+        for prepared in prepared_schedules:
+            if prepared.config_id:
+                by_id.setdefault(prepared.config_id, prepared.order)
+            else:
+                by_name_without_id.setdefault(prepared.name_casefold, prepared.order)
+            by_name.setdefault(prepared.name_casefold, prepared.order)
+        return by_id, by_name, by_name_without_id
+
+    def _find_schedule_index(self, config: Mapping[str, Any], *candidates: Tuple[int, Optional[str]]) -> Optional[int]:
+        """Return the lowest schedule index matched by any (index kind, key) candidate."""
+        self._get_prepared_schedules(config)
+        matches = [
+            self._schedule_index[kind][key]
+            for kind, key in candidates
+            if key is not None and key in self._schedule_index[kind]
+        ]
+        return min(matches) if matches else None
+
+    def _prepare_schedules(self, config: Mapping[str, Any]) -> Tuple[_PreparedSchedule, ...]:
+        """Parse schedule configuration into evaluation-ready form."""
+        schedules = config.get(CONF_SCHEDULES, [])
+        enabled_overrides = config.get(CONF_SCHEDULE_OVERRIDES)
+        configured_devices = frozenset(config.get(CONF_CLIMATE_DEVICES, []))
+        auto_end_times = self._derive_auto_end_times(schedules, enabled_overrides)
+
+        prepared: List[_PreparedSchedule] = []
+        for index, schedule in enumerate(schedules):
+            schedule_id = schedule_key(schedule, index)
+            schedule_name = schedule.get(CONF_SCHEDULE_NAME, "Unnamed")
+            start_time = str(schedule.get(CONF_SCHEDULE_START, DEFAULT_SCHEDULE_START))[:5]
+            configured_end = schedule.get(CONF_SCHEDULE_END)
+            if configured_end:
+                end_time = str(configured_end)[:5]
+            else:
+                end_time = auto_end_times.get(schedule_id, DEFAULT_SCHEDULE_END)
+
+            schedule_trackers = schedule.get(CONF_SCHEDULE_DEVICE_TRACKERS, [])
+
+            hvac_mode_home = str(
+                schedule.get(CONF_SCHEDULE_HVAC_MODE, DEFAULT_SCHEDULE_HVAC_MODE)
+            ).lower()
+            hvac_mode_away_raw = schedule.get(CONF_SCHEDULE_AWAY_HVAC_MODE)
+            hvac_mode_away = (
+                str(hvac_mode_away_raw).lower()
+                if hvac_mode_away_raw not in (None, "", "inherit")
+                else None
+            )
+
+            device_entities = schedule.get(CONF_SCHEDULE_DEVICES, [])
+
+            # Validate that schedule devices are in the configured climate devices list
+            unknown_devices = set(device_entities) - configured_devices
+            if unknown_devices:
+                _LOGGER.warning(
+                    "Schedule '%s' references devices not in climate_devices: %s. "
+                    "These devices will be ignored.",
+                    schedule_name,
+                    list(unknown_devices),
+                )
+                # Filter to only known devices
+                device_entities = [d for d in device_entities if d in configured_devices]
+
+            schedule_temp_home = schedule.get(CONF_SCHEDULE_TEMPERATURE)
+            if schedule_temp_home is None:
+                schedule_temp_home = DEFAULT_SCHEDULE_TEMPERATURE
+
+            schedule_temp_away = schedule.get(CONF_SCHEDULE_AWAY_TEMPERATURE)
+            if schedule_temp_away is not None:
+                schedule_temp_away = float(schedule_temp_away)
+
+            prepared.append(
+                _PreparedSchedule(
+                    order=index,
+                    schedule_id=schedule_id,
+                    config_id=schedule.get(CONF_SCHEDULE_ID),
+                    name=schedule_name,
+                    name_casefold=(schedule.get(CONF_SCHEDULE_NAME) or "").casefold(),
+                    enabled=_is_schedule_enabled(schedule, schedule_id, enabled_overrides),
+                    start_time=start_time,
+                    end_time=end_time,
+                    start_minutes=_parse_time_to_minutes(start_time, _LOGGER),
+                    end_minutes=_parse_time_to_minutes(end_time, _LOGGER),
+                    only_when_home=schedule.get(CONF_SCHEDULE_ONLY_WHEN_HOME, True),
+                    schedule_trackers=tuple(schedule_trackers),
+                    # Filter out None, empty strings, and other falsy values
+                    valid_trackers=tuple(t for t in schedule_trackers if t),
+                    hvac_mode_home=hvac_mode_home,
+                    hvac_mode_away=hvac_mode_away,
+                    home_supports_temp=_mode_supports_temperature(hvac_mode_home),
+                    away_supports_temp=_mode_supports_temperature(hvac_mode_away),
+                    devices=tuple(device_entities),
+                    temp_home=float(schedule_temp_home),
+                    temp_away=schedule_temp_away,
+                    fan_mode=schedule.get(CONF_SCHEDULE_FAN_MODE, DEFAULT_SCHEDULE_FAN_MODE),
+                    # Note: Default to WARM for migration - existing schedules without this field
+                    # will be treated as "warm" schedules (active when outdoor temp >= threshold)
+                    temp_condition=schedule.get(
+                        CONF_SCHEDULE_TEMP_CONDITION, TEMP_CONDITION_WARM
+                    ),
+                )
+            )
+
+        return tuple(prepared)
 
     @staticmethod
-    def _derive_auto_end_times(schedules: List[dict]) -> Dict[str, str]:
+    def _derive_auto_end_times(
+        schedules: List[dict],
+        enabled_overrides: Optional[Mapping[str, bool]] = None,
+    ) -> Dict[str, str]:
         """Derive implicit end times per-device to allow overlapping schedules for different devices.
 
         A schedule runs from its start time until another schedule starts. This means:
@@ -524,6 +942,7 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
 
         Args:
             schedules: List of schedule configurations (dicts with CONF_* keys)
+            enabled_overrides: Optional schedule_id -> enabled map from toggles
 
         Returns:
             Dict mapping schedule_id to derived end time (HH:MM format)
@@ -540,15 +959,11 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         schedule_info: Dict[str, Tuple[int, str, int, List[str]]] = {}
 
         for index, schedule in enumerate(schedules):
-            if not schedule.get(CONF_SCHEDULE_ENABLED, True):
+            schedule_id = schedule_key(schedule, index)
+            if not _is_schedule_enabled(schedule, schedule_id, enabled_overrides):
                 # Disabled schedules don't affect timing at all
                 continue
 
-            schedule_id = (
-                schedule.get(CONF_SCHEDULE_ID)
-                or schedule.get(CONF_SCHEDULE_NAME)
-                or f"schedule_{index}"
-            )
             raw_start = str(schedule.get(CONF_SCHEDULE_START, DEFAULT_SCHEDULE_START))
             start_hm = raw_start[:5]
 
@@ -652,10 +1067,15 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         Uses minute-based comparison for robustness instead of string comparison.
         String comparison can fail with non-zero-padded hours (e.g., "9:30" > "10:00").
         """
-        now_m = _parse_time_to_minutes(now_hm, _LOGGER)
-        start_m = _parse_time_to_minutes(start_hm, _LOGGER)
-        end_m = _parse_time_to_minutes(end_hm, _LOGGER)
+        return HeatingControlCoordinator._is_minute_in_schedule(
+            _parse_time_to_minutes(now_hm, _LOGGER),
+            _parse_time_to_minutes(start_hm, _LOGGER),
+            _parse_time_to_minutes(end_hm, _LOGGER),
+        )
 
+    @staticmethod
+    def _is_minute_in_schedule(now_m: int, start_m: int, end_m: int) -> bool:
+        """Check if a minute of the day is within a schedule, all in minutes since midnight."""
         if start_m == end_m:
             return True  # 24/7 schedule
 
@@ -670,9 +1090,29 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         """Calculate the current heating state based on configuration."""
         config = self.config
         now = datetime.now()
-        now_hm = now.strftime("%H:%M")
+        now_hm = f"{now.hour:02d}:{now.minute:02d}"
+        now_minutes = now.hour * 60 + now.minute
+
+        # Tracker states fetched once per cycle and shared by global and per-schedule presence
+        state_cache = self._fetch_tracker_states(config)
+
+        # The snapshot only depends on the minute, config, tracker and outdoor sensor
+        # states, and the hysteresis state, so reuse it while none of them change
+        outdoor_sensor = config.get(CONF_OUTDOOR_TEMP_SENSOR)
+        outdoor_state = self.hass.states.get(outdoor_sensor) if outdoor_sensor else None
+        calc_key = (
+            now_minutes,
+            config,
+            tuple(state.state if state else None for state in state_cache.values()),
+            outdoor_state.state if outdoor_state else None,
+            self._previous_outdoor_temp_state,
+        )
+        if not self._force_update and calc_key == self._last_calc_key:
+            return self._last_calc_snapshot
 
-        tracker_states, anyone_home, everyone_away = self._resolve_presence(config)
+        tracker_states, trackers_home, anyone_home, everyone_away = self._resolve_presence(
+            config, state_cache
+        )
         # Note: _resolve_presence already returns Dict[str, bool], no conversion needed
 
         auto_heating_enabled = config.get(CONF_AUTO_HEATING_ENABLED, True)
@@ -680,25 +1120,25 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         # Get outdoor temperature state for conditional schedules
         outdoor_temp, outdoor_temp_state = self._get_outdoor_temp_state(config)
 
-        schedule_decisions, device_builders, devices_with_schedules = self._evaluate_schedules(
+        schedule_decisions, device_winners, devices_with_schedules = self._evaluate_schedules(
             config,
-            now_hm,
+            now_minutes,
             anyone_home,
             auto_heating_enabled,
             outdoor_temp_state,
+            state_cache,
         )
 
         device_decisions = self._finalize_device_decisions(
             config,
-            device_builders,
+            device_winners,
             devices_with_schedules,
-            now_hm,
         )
 
         diagnostics = DiagnosticsSnapshot(
             now_time=now_hm,
             tracker_states=tracker_states,
-            trackers_home=sum(1 for v in tracker_states.values() if v),
+            trackers_home=trackers_home,
             trackers_total=len(tracker_states),
             auto_heating_enabled=auto_heating_enabled,
             schedule_count=len(config.get(CONF_SCHEDULES, [])),
@@ -710,55 +1150,80 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
             outdoor_temp_state=outdoor_temp_state,
         )
 
-        return HeatingStateSnapshot(
+        snapshot = HeatingStateSnapshot(
             everyone_away=everyone_away,
             anyone_home=anyone_home,
             schedule_decisions=schedule_decisions,
             device_decisions=device_decisions,
             diagnostics=diagnostics,
         )
+        self._last_calc_key = calc_key
+        self._last_calc_snapshot = snapshot
+        return snapshot
 
-    def _resolve_presence(self, config: Dict[str, Any]) -> Tuple[Dict[str, bool], bool, bool]:
-        """Determine presence based on configured device trackers."""
-        tracker_entities = [
-            tracker for tracker in config.get(CONF_DEVICE_TRACKERS, []) if tracker
-        ]
+    def _fetch_tracker_states(self, config: Dict[str, Any]) -> Dict[str, Optional[State]]:
+        """Fetch the state of every global and per-schedule tracker in a single pass."""
+        self._get_prepared_schedules(config)
+        states_get = self.hass.states.get
+        return {tracker: states_get(tracker) for tracker in self._presence_entities}
+
+    def _resolve_presence(
+        self,
+        config: Dict[str, Any],
+        state_cache: Optional[Dict[str, Optional[State]]] = None,
+    ) -> Tuple[Dict[str, bool], int, bool, bool]:
+        """Determine presence based on configured device trackers.
+
+        Returns:
+            Tuple of (tracker_states, trackers_home, anyone_home, everyone_away),
+            with the home count accumulated in the same pass as the states.
+        """
+        self._get_prepared_schedules(config)
+        tracker_entities = self._global_trackers
 
         if not tracker_entities:
             # Presence tracking disabled; assume occupants are home so schedules remain eligible.
-            return {}, True, False
+            return {}, 0, True, False
+
+        if state_cache is None:
+            state_cache = self._fetch_tracker_states(config)
 
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
         tracker_states: Dict[str, bool] = {}
+        trackers_home = 0
         for tracker in tracker_entities:
-            tracker_states[tracker] = self._is_tracker_home(tracker)
+            state = state_cache.get(tracker)
+            if not state:
+                if debug_enabled:
+                    _LOGGER.debug(
+                        "Tracker %s has no state object (entity may not exist)", tracker
+                    )
+                tracker_states[tracker] = False
+                continue
 
-        anyone_home = any(tracker_states.values())
-        everyone_away = not anyone_home
+            is_home = state.state == STATE_HOME
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Tracker %s state='%s', is_home=%s", tracker, state.state, is_home
+                )
+            tracker_states[tracker] = is_home
+            trackers_home += is_home
 
-        return tracker_states, anyone_home, everyone_away
+        anyone_home = trackers_home > 0
+        everyone_away = not anyone_home
 
-    def _is_tracker_home(self, entity_id: Optional[str]) -> bool:
-        """Return True if the given tracker entity is in STATE_HOME."""
-        if not entity_id:
-            _LOGGER.debug("Tracker entity_id is empty or None")
-            return False
+        return tracker_states, trackers_home, anyone_home, everyone_away
 
-        state: Optional[State] = self.hass.states.get(entity_id)
-        if not state:
-            _LOGGER.debug(
-                "Tracker %s has no state object (entity may not exist)", entity_id
-            )
-            return False
-
-        is_home = state.state == STATE_HOME
-        _LOGGER.debug(
-            "Tracker %s state='%s', STATE_HOME='%s', is_home=%s",
-            entity_id,
-            state.state,
-            STATE_HOME,
-            is_home,
-        )
-        return is_home
+    def _outdoor_reading_state(self, config: Dict[str, Any], state: Optional[State]) -> str:
+        """Return the cold/warm state a sensor reading would lead to, without logging."""
+        if not state or state.state in _UNUSABLE_STATES:
+            return "warm"
+        try:
+            outdoor_temp = float(state.state)
+        except (ValueError, TypeError):
+            return "warm"
+        threshold = config.get(CONF_OUTDOOR_TEMP_THRESHOLD, DEFAULT_OUTDOOR_TEMP_THRESHOLD)
+        return _classify_outdoor_temp(outdoor_temp, threshold, self._previous_outdoor_temp_state)
 
     def _get_outdoor_temp_state(self, config: Dict[str, Any]) -> Tuple[Optional[float], str]:
         """Get outdoor temperature and determine if it's 'cold' or 'warm'.
@@ -782,7 +1247,7 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
             return None, "warm"
 
         state = self.hass.states.get(sensor_entity)
-        if not state or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+        if not state or state.state in _UNUSABLE_STATES:
             _LOGGER.warning(
                 "Outdoor temperature sensor %s is unavailable, defaulting to 'warm' state",
                 sensor_entity,
@@ -799,17 +1264,8 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
             )
             return None, "warm"
 
-        # Schmitt trigger logic with hysteresis
         previous_state = self._previous_outdoor_temp_state
-        if previous_state is None:
-            # First run: use simple threshold comparison
-            temp_state = "cold" if outdoor_temp < threshold else "warm"
-        elif previous_state == "cold":
-            # Currently cold: only switch to warm if temp >= threshold + hysteresis
-            temp_state = "warm" if outdoor_temp >= threshold + hysteresis else "cold"
-        else:
-            # Currently warm: only switch to cold if temp < threshold
-            temp_state = "cold" if outdoor_temp < threshold else "warm"
+        temp_state = _classify_outdoor_temp(outdoor_temp, threshold, previous_state)
 
         # Log state transitions
         if previous_state != temp_state:
@@ -835,13 +1291,14 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
     def _evaluate_schedules(
         self,
         config,
-        now_hm: str,
+        now_minutes: int,
         anyone_home: bool,
         auto_heating_enabled: bool,
         outdoor_temp_state: str,
+        state_cache: Optional[Dict[str, Optional[State]]] = None,
     ) -> Tuple[
         Dict[str, ScheduleDecision],
-        Dict[str, List[Dict[str, Any]]],
+        Dict[str, _ScheduleEntryBuilder],
         Set[str],
     ]:
         """Evaluate all configured schedules and prepare device aggregations.
@@ -849,59 +1306,40 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         Returns:
             Tuple of:
             - schedule_decisions: Per-schedule evaluation results
-            - device_builders: Active schedule entries per device
+            - device_winners: Winning active schedule entry per device
             - devices_with_schedules: Set of all devices that have any schedules
         """
-        schedules = config.get(CONF_SCHEDULES, [])
         schedule_decisions: Dict[str, ScheduleDecision] = {}
-        device_builders: Dict[str, List[Dict[str, Any]]] = {}
+        device_winners: Dict[str, _ScheduleEntryBuilder] = {}
         devices_with_schedules: Set[str] = set()
 
-        now_minutes = _parse_time_to_minutes(now_hm, _LOGGER)
+        if state_cache is None:
+            state_cache = self._fetch_tracker_states(config)
 
-        auto_end_times = self._derive_auto_end_times(schedules)
-
-        for index, schedule in enumerate(schedules):
-            schedule_id = (
-                schedule.get(CONF_SCHEDULE_ID)
-                or schedule.get(CONF_SCHEDULE_NAME)
-                or f"schedule_{index}"
-            )
-            schedule_name = schedule.get(CONF_SCHEDULE_NAME, "Unnamed")
-            enabled = schedule.get(CONF_SCHEDULE_ENABLED, True)
-            start_time = str(schedule.get(CONF_SCHEDULE_START, DEFAULT_SCHEDULE_START))[:5]
-            configured_end = schedule.get(CONF_SCHEDULE_END)
-            if configured_end:
-                end_time = str(configured_end)[:5]
-            else:
-                end_time = auto_end_times.get(schedule_id, DEFAULT_SCHEDULE_END)
+        # Bound once: these are looked up for every schedule and tracker
+        state_cache_get = state_cache.get
+        winners_get = device_winners.get
+        is_minute_in_schedule = self._is_minute_in_schedule
 
-            start_value = _parse_time_to_minutes(start_time, _LOGGER)
+        for prepared in self._get_prepared_schedules(config):
+            schedule_id = prepared.schedule_id
+            schedule_name = prepared.name
+            start_time = prepared.start_time
+            end_time = prepared.end_time
+            start_value = prepared.start_minutes
             start_age = (now_minutes - start_value) % MINUTES_PER_DAY
-
-            only_when_home = schedule.get(CONF_SCHEDULE_ONLY_WHEN_HOME, True)
-
-            # Per-schedule presence tracking
-            schedule_trackers = schedule.get(CONF_SCHEDULE_DEVICE_TRACKERS, [])
-            # Filter out None, empty strings, and other falsy values
-            valid_schedule_trackers = [t for t in schedule_trackers if t]
-
-            # Fetch states ONCE and store string values to prevent race conditions
-            # Store both State object and its state string value atomically
-            tracker_states: Dict[str, Tuple[Optional[State], Optional[str]]] = {
-                t: (
-                    (state := self.hass.states.get(t)),
-                    state.state if state else None
-                )
-                for t in valid_schedule_trackers
-            }
-
-            # Filter to usable trackers (with valid, available states)
-            usable_tracker_state_values: Dict[str, str] = {}
-            for tracker, (state_obj, state_value) in tracker_states.items():
-                if not state_obj or not state_value:
+            only_when_home = prepared.only_when_home
+            valid_schedule_trackers = prepared.valid_trackers
+
+            # Single pass over the per-schedule trackers: skip unusable states and
+            # stop at the first tracker that is home. None means no tracker was usable.
+            schedule_presence: Optional[bool] = None
+            for tracker in valid_schedule_trackers:
+                state_obj = state_cache_get(tracker)
+                state_value = state_obj.state if state_obj else None
+                if not state_value:
                     continue
-                if state_value in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+                if state_value in _UNUSABLE_STATES:
                     _LOGGER.debug(
                         "Schedule '%s' tracker %s is %s, falling back to global presence",
                         schedule_name,
@@ -909,69 +1347,32 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
                         state_value,
                     )
                     continue
-                usable_tracker_state_values[tracker] = state_value
-
-            # Log warning if trackers were specified but all are invalid
-            if valid_schedule_trackers and not usable_tracker_state_values:
-                _LOGGER.warning(
-                    "Schedule '%s' has per-schedule trackers configured %s but none are usable. "
-                    "Falling back to global presence tracking.",
-                    schedule_name,
-                    valid_schedule_trackers,
-                )
-
-            if usable_tracker_state_values:
-                # Use the captured state string values (prevents race condition)
-                schedule_anyone_home = any(
-                    state_value == STATE_HOME
-                    for state_value in usable_tracker_state_values.values()
-                )
-            else:
+                if state_value == STATE_HOME:
+                    schedule_presence = True
+                    break
+                schedule_presence = False
+
+            if schedule_presence is None:
+                # Log warning if trackers were specified but all are invalid
+                if valid_schedule_trackers:
+                    _LOGGER.warning(
+                        "Schedule '%s' has per-schedule trackers configured %s but none are usable. "
+                        "Falling back to global presence tracking.",
+                        schedule_name,
+                        list(valid_schedule_trackers),
+                    )
                 # No specific trackers or all invalid: fall back to global presence
                 schedule_anyone_home = anyone_home
+            else:
+                schedule_anyone_home = schedule_presence
 
-            hvac_mode_home = str(
-                schedule.get(CONF_SCHEDULE_HVAC_MODE, DEFAULT_SCHEDULE_HVAC_MODE)
-            ).lower()
-            hvac_mode_away_raw = schedule.get(CONF_SCHEDULE_AWAY_HVAC_MODE)
-            hvac_mode_away = (
-                str(hvac_mode_away_raw).lower()
-                if hvac_mode_away_raw not in (None, "", "inherit")
-                else None
-            )
-
-            device_entities = schedule.get(CONF_SCHEDULE_DEVICES, [])
-
-            # Validate that schedule devices are in the configured climate devices list
-            configured_devices = set(config.get(CONF_CLIMATE_DEVICES, []))
-            unknown_devices = set(device_entities) - configured_devices
-            if unknown_devices:
-                _LOGGER.warning(
-                    "Schedule '%s' references devices not in climate_devices: %s. "
-                    "These devices will be ignored.",
-                    schedule_name,
-                    list(unknown_devices),
-                )
-                # Filter to only known devices
-                device_entities = [d for d in device_entities if d in configured_devices]
-
-            schedule_temp_home = schedule.get(CONF_SCHEDULE_TEMPERATURE)
-            if schedule_temp_home is None:
-                schedule_temp_home = DEFAULT_SCHEDULE_TEMPERATURE
-            schedule_temp_home = float(schedule_temp_home)
-
-            schedule_temp_away = schedule.get(CONF_SCHEDULE_AWAY_TEMPERATURE)
-            if schedule_temp_away is not None:
-                schedule_temp_away = float(schedule_temp_away)
-
-            schedule_fan = schedule.get(
-                CONF_SCHEDULE_FAN_MODE, DEFAULT_SCHEDULE_FAN_MODE
-            )
-
-            # Get temperature condition for this schedule
-            # Note: Default to WARM for migration - existing schedules without this field
-            # will be treated as "warm" schedules (active when outdoor temp >= threshold)
-            temp_condition = schedule.get(CONF_SCHEDULE_TEMP_CONDITION, TEMP_CONDITION_WARM)
+            hvac_mode_home = prepared.hvac_mode_home
+            hvac_mode_away = prepared.hvac_mode_away
+            device_entities = prepared.devices
+            schedule_temp_home = prepared.temp_home
+            schedule_temp_away = prepared.temp_away
+            schedule_fan = prepared.fan_mode
+            temp_condition = prepared.temp_condition
 
             # Evaluate if temperature condition is met
             if temp_condition == TEMP_CONDITION_ALWAYS:
@@ -984,8 +1385,8 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
                 # Unknown condition, treat as always
                 temp_condition_met = True
 
-            in_time_window = self._is_time_in_schedule(
-                now_hm, start_time, end_time
+            in_time_window = is_minute_in_schedule(
+                now_minutes, start_value, prepared.end_minutes
             )
             presence_ok = schedule_anyone_home or not only_when_home
             has_away_settings = hvac_mode_away is not None
@@ -994,7 +1395,7 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
             # (presence affects settings, not activation)
             is_active = (
                 auto_heating_enabled
-                and enabled
+                and prepared.enabled
                 and in_time_window
                 and temp_condition_met
             )
@@ -1017,10 +1418,11 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
                 effective_hvac_mode = hvac_mode_home
                 effective_temp = schedule_temp_home
 
-            if effective_hvac_mode in (None, "off"):
+            mode_class = _classify_mode(effective_hvac_mode)
+            if mode_class == _MODE_OFF:
                 effective_temp = None
                 effective_fan = None
-            elif not _mode_supports_temperature(effective_hvac_mode):
+            elif mode_class == _MODE_NO_TEMP:
                 effective_temp = None
                 effective_fan = schedule_fan
             else:
@@ -1035,60 +1437,65 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
                 hvac_mode_home=hvac_mode_home,
                 hvac_mode_away=hvac_mode_away,
                 only_when_home=only_when_home,
-                enabled=enabled,
+                enabled=prepared.enabled,
                 is_active=is_active,
                 in_time_window=in_time_window,
                 presence_ok=presence_ok,
                 temp_condition=temp_condition,
                 temp_condition_met=temp_condition_met,
                 device_count=len(device_entities),
-                devices=tuple(device_entities),
-                schedule_device_trackers=tuple(schedule_trackers),
+                devices=device_entities,
+                schedule_device_trackers=prepared.schedule_trackers,
                 target_temp=effective_temp,
-                target_temp_home=(
-                    schedule_temp_home
-                    if _mode_supports_temperature(hvac_mode_home)
-                    else None
-                ),
-                target_temp_away=(
-                    schedule_temp_away
-                    if hvac_mode_away and _mode_supports_temperature(hvac_mode_away)
-                    else None
-                ),
+                target_temp_home=schedule_temp_home if prepared.home_supports_temp else None,
+                target_temp_away=schedule_temp_away if prepared.away_supports_temp else None,
                 target_fan=effective_fan,
             )
 
             # Track all devices that have any schedules (for turn-off logic)
-            for device_entity in device_entities:
-                devices_with_schedules.add(device_entity)
+            devices_with_schedules.update(device_entities)
 
             if not is_active:
                 continue
 
+            # Entries are immutable, so devices sharing a schedule share one
+            entry = _ScheduleEntryBuilder(
+                schedule_name=schedule_name,
+                schedule_id=schedule_id,
+                order=prepared.order,
+                start_minutes=start_value,
+                start_age=start_age,
+                start_time=start_time,
+                end_time=end_time,
+                hvac_mode=effective_hvac_mode,
+                temperature=effective_temp,
+                fan_mode=effective_fan,
+                sort_key=(MINUTES_PER_DAY - start_age, prepared.order),
+            )
+            # Keep only the winning entry per device instead of collecting candidates
             for device_entity in device_entities:
-                device_builders.setdefault(device_entity, []).append(
-                    {
-                        "schedule_name": schedule_name,
-                        "schedule_id": schedule_id,
-                        "order": index,
-                        "start_minutes": start_value,
-                        "start_age": start_age,
-                        "start_time": start_time,
-                        "end_time": end_time,
-                        "hvac_mode": effective_hvac_mode,
-                        "temperature": effective_temp,
-                        "fan_mode": effective_fan,
-                    }
-                )
-
-        return schedule_decisions, device_builders, devices_with_schedules
+                current = winners_get(device_entity)
+                if current is None:
+                    device_winners[device_entity] = entry
+                elif entry.sort_key > current.sort_key:
+                    device_winners[device_entity] = entry
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "Schedule '%s' (start_age=%d, order=%d) supersedes '%s' for %s",
+                            schedule_name,
+                            start_age,
+                            prepared.order,
+                            current.schedule_name,
+                            device_entity,
+                        )
+
+        return schedule_decisions, device_winners, devices_with_schedules
 
     def _finalize_device_decisions(
         self,
         config,
-        device_builders: Dict[str, List[Dict[str, Any]]],
+        device_winners: Dict[str, _ScheduleEntryBuilder],
         devices_with_schedules: Set[str],
-        now_hm: str,
     ) -> Dict[str, DeviceDecision]:
         """Create DeviceDecision objects for each configured device.
 
@@ -1122,11 +1529,8 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
                 )
                 continue
 
-            entries = device_builders.get(device_entity, [])
-
             hvac_mode, target_temp, target_fan, schedule_id = self._select_device_targets(
-                entries,
-                now_hm,
+                device_winners.get(device_entity)
             )
 
             # Determine hvac_mode for devices without active schedules:
@@ -1153,78 +1557,24 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
 
     @staticmethod
     def _select_device_targets(
-        entries: List[Dict[str, Any]],
-        now_hm: str,
+        best: Optional[_ScheduleEntryBuilder],
     ) -> Tuple[Optional[str], Optional[float], Optional[str], Optional[str]]:
         """Select the hvac mode, temperature, and fan for a device.
 
-        Selects the schedule with the most recent start time among those that:
-        1. Are currently in their time window (double-check to catch edge cases)
-        2. Have the highest "freshness" (most recently started)
-        3. Break ties by schedule order (higher order = later in config, wins)
+        ``best`` is the device's winning active schedule entry, already chosen
+        while evaluating schedules:
+        1. The highest "freshness" (most recently started)
+        2. Breaking ties by schedule order (higher order = later in config, wins)
         """
-        if not entries:
+        if best is None:
             return None, None, None, None
 
-        # Filter to only schedules that are currently in their time window
-        # This is a safety check - entries should already be filtered, but this catches edge cases
-        valid_entries = []
-        for entry in entries:
-            start_time = entry.get("start_time", "00:00")
-            end_time = entry.get("end_time", "23:59")
+        mode = best.hvac_mode
 
-            # Check if current time is within this schedule's window
-            if HeatingControlCoordinator._is_time_in_schedule(now_hm, start_time, end_time):
-                valid_entries.append(entry)
-            else:
-                # Log when we filter out a schedule that shouldn't be in entries
-                _LOGGER.debug(
-                    "Filtered out schedule '%s' (not in time window: now=%s, window=%s-%s)",
-                    entry.get("schedule_name", "Unknown"),
-                    now_hm,
-                    start_time,
-                    end_time,
-                )
-
-        if not valid_entries:
-            # No schedules are actually in their time window
-            _LOGGER.debug(
-                "No valid schedules found for device (had %d entries, none in time window)",
-                len(entries),
-            )
-            return None, None, None, None
+        if mode in _OFF_MODES:
+            return mode, None, None, best.schedule_id
 
-        def entry_key(entry: Dict[str, Any]) -> Tuple[int, int]:
-            age = entry.get("start_age")
-            if age is None:
-                # Fallback: treat start_minutes as age so the freshness
-                # semantics stay consistent (lower age → higher freshness).
-                age = entry.get("start_minutes", 0)
-            freshness = MINUTES_PER_DAY - int(age)
-            return (
-                freshness,
-                entry.get("order", 0),
-            )
-
-        best = max(valid_entries, key=entry_key)
-        mode = best.get("hvac_mode")
-        temperature = best.get("temperature")
-        fan_mode = best.get("fan_mode")
-
-        # Log the selection for debugging
-        if len(valid_entries) > 1:
-            _LOGGER.debug(
-                "Selected schedule '%s' from %d candidates (start_age=%d, order=%d)",
-                best.get("schedule_name", "Unknown"),
-                len(valid_entries),
-                best.get("start_age", 0),
-                best.get("order", 0),
-            )
-
-        if mode in (None, "off"):
-            return mode, None, None, best.get("schedule_id")
-
-        return mode, temperature, fan_mode, best.get("schedule_id")
+        return mode, best.temperature, best.fan_mode, best.schedule_id
 
     async def async_set_schedule_enabled(
         self,
@@ -1233,7 +1583,13 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         schedule_name: Optional[str] = None,
         enabled: bool,
     ) -> None:
-        """Enable or disable a schedule and persist the change."""
+        """Enable or disable a schedule and persist the change.
+
+        The new state is stored in a small ``CONF_SCHEDULE_OVERRIDES`` map
+        keyed by schedule ID, so a toggle never copies or rewrites the
+        schedules list itself. The options flow folds overrides back into
+        the schedules the next time they are edited.
+        """
         config_entry = self.config_entry
         source = config_entry.options or config_entry.data
         schedules = source.get(CONF_SCHEDULES, [])
@@ -1241,45 +1597,27 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         if not schedules:
             raise ValueError("No schedules are configured for this entry")
 
-        new_schedules = deepcopy(schedules)
         # Check for empty strings in addition to None
         target_name = schedule_name.casefold() if schedule_name and schedule_name.strip() else None
         target_id_casefold = schedule_id.casefold() if schedule_id and schedule_id.strip() else None
-        updated = False
-        matched = False
-
-        for schedule in new_schedules:
-            current_id = schedule.get(CONF_SCHEDULE_ID)
-            current_name = schedule.get(CONF_SCHEDULE_NAME, "")
-
-            id_matches = False
-            if schedule_id:
-                if current_id == schedule_id:
-                    id_matches = True
-                elif not current_id and current_name.casefold() == target_id_casefold:
-                    id_matches = True
-
-            name_matches = (
-                target_name is not None and current_name.casefold() == target_name
-            )
-
-            if not id_matches and not name_matches:
-                continue
 
-            matched = True
-
-            if schedule.get(CONF_SCHEDULE_ENABLED, True) == enabled:
-                break
-
-            schedule[CONF_SCHEDULE_ENABLED] = enabled
-            updated = True
-            break
+        # An ID matches a schedule's ID, or the name of a schedule without an ID
+        index = self._find_schedule_index(
+            source,
+            (_INDEX_BY_ID, schedule_id or None),
+            (_INDEX_BY_NAME_WITHOUT_ID, target_id_casefold),
+            (_INDEX_BY_NAME, target_name),
+        )
 
-        if not matched:
+        if index is None:
             identifier = schedule_id or schedule_name or "unknown"
             raise ValueError(f"Schedule '{identifier}' was not found")
 
-        if not updated:
+        matched_schedule: Dict[str, Any] = schedules[index]
+        matched_key = self._prepared_schedules[index].schedule_id
+
+        current_overrides: Mapping[str, bool] = source.get(CONF_SCHEDULE_OVERRIDES) or {}
+        if _is_schedule_enabled(matched_schedule, matched_key, current_overrides) == enabled:
             _LOGGER.debug(
                 "Schedule %s already %s",
                 schedule_id or schedule_name,
@@ -1287,22 +1625,31 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
             )
             return
 
+        new_overrides = dict(current_overrides)
+        if matched_schedule.get(CONF_SCHEDULE_ENABLED, True) == enabled:
+            # Back to the stored value - drop the override instead of recording it
+            new_overrides.pop(matched_key, None)
+        else:
+            new_overrides[matched_key] = enabled
+
         update_kwargs: Dict[str, Dict] = {}
         if config_entry.options:
             new_options = dict(config_entry.options)
-            new_options[CONF_SCHEDULES] = new_schedules
+            new_options[CONF_SCHEDULE_OVERRIDES] = new_overrides
             update_kwargs["options"] = new_options
         else:
             new_data = dict(config_entry.data)
-            new_data[CONF_SCHEDULES] = new_schedules
+            new_data[CONF_SCHEDULE_OVERRIDES] = new_overrides
             update_kwargs["data"] = new_data
 
         # Increment counter to skip full reload - this is just a toggle change.
         # Concurrent toggles are serialised by HA's single-threaded event loop,
         # so there is no true race condition.  The counter (rather than a bool)
         # handles rapid successive toggles: each toggle increments on entry and
-        # decrements when its background refresh completes, so the "in-progress"
-        # window is only closed once all pending refreshes finish.
+        # decrements once the queued refresh covering it has run.  Toggles that
+        # arrive before that refresh starts share it; a toggle during a running
+        # refresh queues one more run, since the debouncer behind
+        # async_request_refresh would drop it until the next poll.
         self._soft_update_count += 1
 
         # Update config entry (callback method; no await needed)
@@ -1314,9 +1661,9 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         self._force_update = True
 
         async def _background_refresh() -> None:
-            """Perform refresh and decrement counter when done."""
+            """Wait for a queued refresh, then decrement the counter."""
             try:
-                await self.async_refresh()
+                await self._async_queue_refresh()
             except Exception as err:
                 _LOGGER.warning("Background refresh failed after schedule toggle: %s", err)
             finally:
@@ -1324,6 +1671,27 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
 
         self.hass.async_create_task(_background_refresh())
 
+    @callback
+    def _async_queue_refresh(self) -> asyncio.Task:
+        """Queue a refresh and return the task that will run it.
+
+        Requests made before the task reaches a refresh share it; a request made
+        while a refresh is running makes the task refresh once more afterwards.
+        """
+        self._refresh_requested = True
+        task = self._queued_refresh
+        if task is None or task.done():
+            task = self._queued_refresh = self.hass.async_create_task(
+                self._async_run_queued_refreshes()
+            )
+        return task
+
+    async def _async_run_queued_refreshes(self) -> None:
+        """Refresh until no request is left pending."""
+        while self._refresh_requested:
+            self._refresh_requested = False
+            await self.async_refresh()
+
     async def async_set_device_enabled(
         self,
         *,
@@ -1394,9 +1762,9 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         self._force_update = True
 
         async def _background_refresh() -> None:
-            """Perform refresh and decrement counter when done."""
+            """Wait for a queued refresh, then decrement the counter."""
             try:
-                await self.async_refresh()
+                await self._async_queue_refresh()
             except Exception as err:
                 _LOGGER.warning("Background refresh failed after device toggle: %s", err)
             finally:
@@ -1464,9 +1832,9 @@ class HeatingControlCoordinator(DataUpdateCoordinator[HeatingStateSnapshot]):
         self._force_update = True
 
         async def _background_refresh() -> None:
-            """Perform refresh and decrement counter when done."""
+            """Wait for a queued refresh, then decrement the counter."""
             try:
-                await self.async_refresh()
+                await self._async_queue_refresh()
             except Exception as err:
                 _LOGGER.warning("Background refresh failed after master toggle: %s", err)
             finally:
@@ -13,8 +13,14 @@ Key features:
 """
 from __future__ import annotations
 
+import copy
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+import weakref
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain, product
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,6 +31,7 @@ except ImportError:  # Home Assistant version without Lovelace strategies suppor
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
 from homeassistant.util import slugify
 
 from .const import (
@@ -72,6 +79,112 @@ else:
             )
 
 
+def _nonblank_str(value: Any) -> bool:
+    """Return True for a string with at least one non-whitespace character."""
+    return isinstance(value, str) and bool(value) and not value.isspace()
+
+
+# Entry, schedule and device ids recur on every render; slugify is pure
+_cached_slugify = lru_cache(maxsize=1024)(slugify)
+
+# Static parts of the generated dashboard. Templates are deep-copied into plain
+# dicts on use (see _from_template): the websocket JSON encoder does not
+# serialise mapping proxies, and nested dicts such as tap_action must not be
+# shared between cards or cached renders.
+_VIEW_META = MappingProxyType(
+    {
+        "title": "Smart Heating",
+        "path": "smart-heating",
+        "icon": "mdi:thermostat",
+        "panel": True,
+    }
+)
+_HEADER_CARD = MappingProxyType(
+    {
+        "type": "markdown",
+        "content": "## Smart Heating Dashboard",
+    }
+)
+
+# Static parts of the status grid buttons; only names and icons vary per render
+_MASTER_BUTTON = MappingProxyType(
+    {
+        "type": "button",
+        "entity": MASTER_SWITCH_ENTITY_ID,
+        "name": "All Heating",
+        "icon_height": "50px",
+        "show_name": True,
+        "show_state": True,
+        "tap_action": {"action": "toggle"},
+    }
+)
+_PRESENCE_BUTTON = MappingProxyType(
+    {
+        "type": "button",
+        "entity": ENTITY_PRESENCE,
+        "name": "Presence",
+        "icon": "mdi:home-account",
+        "icon_height": "50px",
+        "show_name": True,
+        "show_state": True,
+        "tap_action": {"action": "more-info"},
+    }
+)
+_COUNTER_BUTTON = MappingProxyType(
+    {
+        "type": "button",
+        "icon_height": "50px",
+        "show_name": True,
+        "show_icon": True,
+        "tap_action": {"action": "none"},
+    }
+)
+_REFRESH_BUTTON = MappingProxyType(
+    {
+        "type": "button",
+        "entity": ENTITY_DECISION_DIAGNOSTICS,
+        "name": "Refresh",
+        "icon": "mdi:refresh",
+        "icon_height": "50px",
+        "show_name": True,
+        "show_state": False,
+        "tap_action": {
+            "action": "call-service",
+            "service": "homeassistant.update_entity",
+            "data": {"entity_id": ENTITY_DECISION_DIAGNOSTICS},
+        },
+    }
+)
+
+
+def _from_template(template: Mapping[str, Any], **overrides: Any) -> Dict[str, Any]:
+    """Return a template as a fresh plain dict, with ``overrides`` applied."""
+    card = copy.deepcopy(dict(template))
+    card.update(overrides)
+    return card
+
+
+def _schedule_status(
+    enabled: bool, is_active: bool, controlling: bool, in_time_window: bool
+) -> Tuple[str, str]:
+    """Return the (status text, status marker) shown on a schedule card."""
+    if not enabled:
+        return "Disabled", STATUS_OFF
+    if is_active:
+        return ("Active" if controlling else "Superseded"), STATUS_ON
+    if in_time_window:
+        return "Window open", STATUS_WAIT
+    return "Idle", ""
+
+
+# Keyed by (enabled, is_active, controls any device, in_time_window)
+_SCHEDULE_STATUS = {flags: _schedule_status(*flags) for flags in product((False, True), repeat=4)}
+
+# Last rendered dashboard per coordinator: (snapshot, options, data, names, config).
+# Reused while the coordinator still holds the same snapshot and config objects.
+_RENDER_CACHE: "weakref.WeakKeyDictionary[Any, Tuple[Any, ...]]" = weakref.WeakKeyDictionary()
+
+
 async def async_get_strategy(hass: HomeAssistant, config: dict[str, Any]) -> Strategy:
     """Return a Heating Control dashboard strategy instance."""
     if not SUPPORTS_DASHBOARD_STRATEGY:
@@ -87,6 +200,10 @@ class HeatingControlDashboardStrategy(Strategy):
     def __init__(self, hass: HomeAssistant, config: Optional[dict[str, Any]] = None) -> None:
         """Initialise the strategy."""
         super().__init__(hass, config or {})
+        # Friendly names resolved during the current async_generate call
+        self._name_cache: Dict[str, str] = {}
+        # Entity registry handle, resolved on the first registry lookup
+        self._registry: Optional[er.EntityRegistry] = None
 
     async def async_generate(self) -> Dict[str, Any]:
         """Return the Lovelace dashboard configuration.
@@ -98,98 +215,125 @@ class HeatingControlDashboardStrategy(Strategy):
         - Device status cards
         - Schedule cards with rich formatting
         """
+        # Names can change between renders; share lookups only within one
+        self._name_cache = {}
         try:
-            coordinator = self._resolve_coordinator()
-            if coordinator is None:
-                return self._build_message(
-                    "Heating Control",
-                    "Heating Control integration is not loaded. "
-                    "Add the integration and ensure it is configured before using this dashboard.",
-                )
-
-            entry_id = coordinator.config_entry.entry_id
-            climate_entities: Sequence[str] = self._get_config_list(
-                coordinator, CONF_CLIMATE_DEVICES
+            return self._build_dashboard()
+        except Exception as err:
+            _LOGGER.exception("Error generating dashboard: %s", err)
+            return self._build_message(
+                "Dashboard Error",
+                f"An error occurred while generating the dashboard: {err}",
             )
-            snapshot = coordinator.data
 
-            tracker_entities: Sequence[str] = self._get_config_list(
-                coordinator, CONF_DEVICE_TRACKERS
+    def _build_dashboard(self) -> Dict[str, Any]:
+        """Build the dashboard for the resolved coordinator (errors handled by the caller)."""
+        coordinator = self._resolve_coordinator()
+        if coordinator is None:
+            return self._build_message(
+                "Heating Control",
+                "Heating Control integration is not loaded. "
+                "Add the integration and ensure it is configured before using this dashboard.",
             )
 
-            # Build all card components
-            cards: List[Dict[str, Any]] = []
+        snapshot = coordinator.data
+        if snapshot is None:
+            return self._build_message(
+                "Smart Heating",
+                "Heating Control is still starting up. "
+                "The dashboard will be available after the first update.",
+            )
 
-            # Header section
-            cards.append(self._build_header_card())
+        config_entry = coordinator.config_entry
+        cached = _RENDER_CACHE.get(coordinator)
+        if (
+            cached is not None
+            and cached[0] is snapshot
+            and cached[1] is config_entry.options
+            and cached[2] is config_entry.data
+            and all(
+                self._resolve_friendly_name(entity_id) == name
+                for entity_id, name in cached[3].items()
+            )
+        ):
+            return cached[4]
+
+        entry_id = config_entry.entry_id
+        # Shared by every switch entity id built below
+        entry_slug = _cached_slugify(entry_id)
+        climate_entities, tracker_entities, disabled_devices = self._get_config_lists(
+            config_entry, CONF_CLIMATE_DEVICES, CONF_DEVICE_TRACKERS, CONF_DISABLED_DEVICES
+        )
 
-            # Quick status grid with buttons
-            cards.append(self._build_status_grid(entry_id, snapshot, tracker_entities, coordinator))
+        # Header section and quick status grid with buttons
+        cards: List[Dict[str, Any]] = [
+            self._build_header_card(),
+            self._build_status_grid(entry_id, snapshot, tracker_entities, coordinator),
+        ]
 
+        # Each remaining section is a markdown header followed by its grid
+        sections = (
             # Climate controls section
-            climate_cards = self._build_climate_grid(climate_entities)
-            if climate_cards:
-                cards.append(climate_cards)
-
+            self._build_climate_grid(climate_entities),
             # Device status section (with enable/disable switches)
-            disabled_devices: Sequence[str] = self._get_config_list(
-                coordinator, CONF_DISABLED_DEVICES
-            )
-            device_status_card = self._build_device_status_section(
-                entry_id, snapshot, climate_entities, disabled_devices
-            )
-            if device_status_card:
-                cards.append(device_status_card)
-
+            self._build_device_status_section(
+                entry_slug,
+                snapshot,
+                climate_entities,
+                disabled_devices,
+                self._build_schedule_name_index(snapshot),
+            ),
             # Schedules section
-            schedule_section = self._build_schedule_section(entry_id, snapshot)
-            if schedule_section:
-                cards.append(schedule_section)
+            self._build_schedule_section(
+                entry_slug, snapshot, self._map_schedule_devices(snapshot)
+            ),
+        )
+        cards.extend(chain.from_iterable(filter(None, sections)))
 
-            return {
-                "title": "Smart Heating",
-                "views": [
-                    {
-                        "title": "Smart Heating",
-                        "path": "smart-heating",
-                        "icon": "mdi:thermostat",
-                        "panel": True,
-                        "cards": [
-                            {
-                                "type": "vertical-stack",
-                                "cards": cards,
-                            }
-                        ],
-                    }
-                ],
-            }
-        except Exception as err:
-            _LOGGER.exception("Error generating dashboard: %s", err)
-            return self._build_message(
-                "Dashboard Error",
-                f"An error occurred while generating the dashboard: {err}",
-            )
+        dashboard = {
+            "title": "Smart Heating",
+            "views": [
+                _from_template(
+                    _VIEW_META,
+                    cards=[
+                        {
+                            "type": "vertical-stack",
+                            "cards": cards,
+                        }
+                    ],
+                )
+            ],
+        }
+        _RENDER_CACHE[coordinator] = (
+            snapshot,
+            config_entry.options,
+            config_entry.data,
+            self._name_cache,
+            dashboard,
+        )
+        return dashboard
 
     def _build_header_card(self) -> Dict[str, Any]:
         """Build the dashboard header with title."""
-        return {
-            "type": "markdown",
-            "content": "## Smart Heating Dashboard",
-        }
+        return _from_template(_HEADER_CARD)
 
     def _build_status_grid(
         self, entry_id: str, snapshot: Optional["HeatingStateSnapshot"], tracker_entities: Sequence[str], coordinator=None
     ) -> Dict[str, Any]:
         """Build a grid of status buttons for at-a-glance system state."""
-        diagnostics = getattr(snapshot, "diagnostics", None) if snapshot else None
+        diagnostics = snapshot.diagnostics if snapshot else None
 
-        active_schedules = 0
-        total_schedules = 0
-        active_devices = 0
+        # DiagnosticsSnapshot always carries these fields; read them directly
         if diagnostics:
-            active_schedules = getattr(diagnostics, "active_schedules", 0)
-            total_schedules = getattr(diagnostics, "schedule_count", 0)
-            active_devices = getattr(diagnostics, "active_devices", 0)
+            active_schedules = diagnostics.active_schedules
+            total_schedules = diagnostics.schedule_count
+            active_devices = diagnostics.active_devices
+            is_cold = diagnostics.outdoor_temp_state == "cold"
+            auto_heating_enabled = diagnostics.auto_heating_enabled
+        else:
+            active_schedules = total_schedules = active_devices = 0
+            is_cold = False
+            auto_heating_enabled = True
 
         # Get outdoor temperature sensor and threshold from config
         outdoor_temp_sensor = None
@@ -199,86 +343,22 @@ class HeatingControlDashboardStrategy(Strategy):
             outdoor_temp_sensor = config.get(CONF_OUTDOOR_TEMP_SENSOR)
             outdoor_temp_threshold = config.get(CONF_OUTDOOR_TEMP_THRESHOLD, DEFAULT_OUTDOOR_TEMP_THRESHOLD)
 
-        # Get outdoor temperature state from diagnostics
-        outdoor_temp = getattr(diagnostics, "outdoor_temp", None) if diagnostics else None
-        outdoor_temp_state = getattr(diagnostics, "outdoor_temp_state", "warm") if diagnostics else "warm"
-        is_cold = outdoor_temp_state == "cold"
-
-        # Check if master heating is enabled
-        auto_heating_enabled = getattr(diagnostics, "auto_heating_enabled", True) if diagnostics else True
-
         buttons: List[Dict[str, Any]] = [
             # Master on/off switch
-            {
-                "type": "button",
-                "entity": MASTER_SWITCH_ENTITY_ID,
-                "name": "All Heating",
-                "icon": "mdi:power" if auto_heating_enabled else "mdi:power-off",
-                "icon_height": "50px",
-                "show_name": True,
-                "show_state": True,
-                "tap_action": {"action": "toggle"},
-            },
-            # Presence button — entity state shows "Home" or "Away" via PRESENCE device class
-            {
-                "type": "button",
-                "entity": ENTITY_PRESENCE,
-                "name": "Presence",
-                "icon": "mdi:home-account",
-                "icon_height": "50px",
-                "show_name": True,
-                "show_state": True,
-                "tap_action": {"action": "more-info"},
-            },
-            # Active schedules indicator
-            {
-                "type": "button",
-                "name": f"{active_schedules}/{total_schedules}",
-                "icon": "mdi:calendar-check" if active_schedules > 0 else "mdi:calendar-blank",
-                "icon_height": "50px",
-                "show_name": True,
-                "show_icon": True,
-                "tap_action": {"action": "none"},
-            },
-            # Active devices indicator
-            {
-                "type": "button",
-                "name": f"{active_devices} Active",
-                "icon": "mdi:thermostat" if active_devices > 0 else "mdi:thermostat-off",
-                "icon_height": "50px",
-                "show_name": True,
-                "show_icon": True,
-                "tap_action": {"action": "none"},
-            },
-            # Refresh button
-            {
-                "type": "button",
-                "entity": ENTITY_DECISION_DIAGNOSTICS,
-                "name": "Refresh",
-                "icon": "mdi:refresh",
-                "icon_height": "50px",
-                "show_name": True,
-                "show_state": False,
-                "tap_action": {
-                    "action": "call-service",
-                    "service": "homeassistant.update_entity",
-                    "data": {"entity_id": ENTITY_DECISION_DIAGNOSTICS},
-                },
-            },
+            _from_template(
+                _MASTER_BUTTON,
+                icon="mdi:power" if auto_heating_enabled else "mdi:power-off",
+            ),
         ]
 
-        # Add outdoor temperature button if sensor is configured
+        # Outdoor temperature button sits next to the master switch when configured
         if outdoor_temp_sensor:
-            # Show current temp, mode (cold/warm), and threshold
-            if outdoor_temp is not None:
-                temp_display = f"{outdoor_temp:g}°"
-            else:
-                temp_display = "N/A"
+            # Show mode (cold/warm) and threshold; the sensor state carries the temperature
             mode_label = "Cold" if is_cold else "Warm"
             mode_icon = "mdi:snowflake" if is_cold else "mdi:weather-sunny"
 
             threshold_label = f"<{outdoor_temp_threshold:g}°" if is_cold else f"≥{outdoor_temp_threshold:g}°"
-            buttons.insert(1, {
+            buttons.append({
                 "type": "button",
                 "entity": outdoor_temp_sensor,
                 "name": f"{mode_label} ({threshold_label})",
@@ -289,10 +369,29 @@ class HeatingControlDashboardStrategy(Strategy):
                 "tap_action": {"action": "more-info"},
             })
 
+        buttons += (
+            # Presence button — entity state shows "Home" or "Away" via PRESENCE device class
+            _from_template(_PRESENCE_BUTTON),
+            # Active schedules indicator
+            _from_template(
+                _COUNTER_BUTTON,
+                name=f"{active_schedules}/{total_schedules}",
+                icon="mdi:calendar-check" if active_schedules > 0 else "mdi:calendar-blank",
+            ),
+            # Active devices indicator
+            _from_template(
+                _COUNTER_BUTTON,
+                name=f"{active_devices} Active",
+                icon="mdi:thermostat" if active_devices > 0 else "mdi:thermostat-off",
+            ),
+            # Refresh button
+            _from_template(_REFRESH_BUTTON),
+        )
+
         grid: Dict[str, Any] = {
             "type": "grid",
             "square": False,
-            "columns": 6 if outdoor_temp_sensor else 5,
+            "columns": len(buttons),
             "cards": buttons,
         }
 
@@ -319,7 +418,7 @@ class HeatingControlDashboardStrategy(Strategy):
 
     def _build_climate_grid(
         self, climate_entities: Sequence[str]
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[List[Dict[str, Any]]]:
         """Build thermostat cards grid for climate devices."""
         if not climate_entities:
             return None
@@ -335,26 +434,24 @@ class HeatingControlDashboardStrategy(Strategy):
 
         column_count = min(max(len(thermostat_cards), 1), 3)
 
-        return {
-            "type": "vertical-stack",
-            "cards": [
-                {"type": "markdown", "content": "### Climate Controls"},
-                {
-                    "type": "grid",
-                    "columns": column_count,
-                    "square": False,
-                    "cards": thermostat_cards,
-                },
-            ],
-        }
+        return [
+            {"type": "markdown", "content": "### Climate Controls"},
+            {
+                "type": "grid",
+                "columns": column_count,
+                "square": False,
+                "cards": thermostat_cards,
+            },
+        ]
 
     def _build_device_status_section(
         self,
-        entry_id: str,
+        entry_slug: str,
         snapshot: Optional["HeatingStateSnapshot"],
         climate_entities: Sequence[str],
         disabled_devices: Sequence[str],
-    ) -> Optional[Dict[str, Any]]:
+        schedule_names: Dict[str, Optional[str]],
+    ) -> Optional[List[Dict[str, Any]]]:
         """Build device status cards with enable/disable switches.
 
         Each device gets an entities card showing:
@@ -365,15 +462,16 @@ class HeatingControlDashboardStrategy(Strategy):
             return None
 
         device_cards: List[Dict[str, Any]] = []
-        disabled_set = set(disabled_devices)
+        disabled_set = frozenset(disabled_devices) if disabled_devices else frozenset()
+        device_decisions = snapshot.device_decisions if snapshot else None
 
         for device_entity in climate_entities:
-            device_decision = None
-            if snapshot and snapshot.device_decisions:
-                device_decision = snapshot.device_decisions.get(device_entity)
+            device_decision = (
+                device_decisions.get(device_entity) if device_decisions else None
+            )
 
             device_name = self._friendly_name(device_entity)
-            switch_entity = self._device_switch_entity(entry_id, device_entity)
+            switch_entity = self._device_switch_entity(entry_slug, device_entity)
             is_disabled = device_entity in disabled_set
 
             # Build status text based on device state
@@ -382,7 +480,7 @@ class HeatingControlDashboardStrategy(Strategy):
                 status_icon = STATUS_OFF
             elif device_decision and device_decision.active_schedules:
                 schedule_name = self._schedule_display_name(
-                    snapshot, device_decision.active_schedules[0]
+                    schedule_names, device_decision.active_schedules[0]
                 )
                 hvac_mode = device_decision.hvac_mode or "off"
                 target_temp = device_decision.target_temp
@@ -411,54 +509,54 @@ class HeatingControlDashboardStrategy(Strategy):
 
         column_count = min(max(len(device_cards), 1), 2)
 
-        return {
-            "type": "vertical-stack",
-            "cards": [
-                {"type": "markdown", "content": "### Device Status"},
-                {
-                    "type": "grid",
-                    "columns": column_count,
-                    "square": False,
-                    "cards": device_cards,
-                },
-            ],
-        }
+        return [
+            {"type": "markdown", "content": "### Device Status"},
+            {
+                "type": "grid",
+                "columns": column_count,
+                "square": False,
+                "cards": device_cards,
+            },
+        ]
+
+    @staticmethod
+    def _map_schedule_devices(
+        snapshot: Optional["HeatingStateSnapshot"],
+    ) -> Dict[str, List[str]]:
+        """Return the devices each schedule currently controls, keyed by schedule_id."""
+        schedule_to_devices: Dict[str, List[str]] = defaultdict(list)
+        if snapshot and snapshot.device_decisions:
+            for device_entity, device_decision in snapshot.device_decisions.items():
+                for sched_id in device_decision.active_schedules:
+                    schedule_to_devices[sched_id].append(device_entity)
+        return schedule_to_devices
 
     def _build_schedule_section(
-        self, entry_id: str, snapshot: Optional["HeatingStateSnapshot"]
-    ) -> Optional[Dict[str, Any]]:
+        self,
+        entry_slug: str,
+        snapshot: Optional["HeatingStateSnapshot"],
+        schedule_to_devices: Dict[str, List[str]],
+    ) -> Optional[List[Dict[str, Any]]]:
         """Build modern schedule cards with rich formatting."""
         if not snapshot or not snapshot.schedule_decisions:
             return None
 
-        # Build map of which devices are controlled by each schedule (keyed by schedule_id)
-        schedule_to_devices: Dict[str, List[str]] = {}
-        if snapshot.device_decisions:
-            for device_entity, device_decision in snapshot.device_decisions.items():
-                if device_decision.active_schedules:
-                    for sched_id in device_decision.active_schedules:
-                        schedule_to_devices.setdefault(sched_id, []).append(
-                            device_entity
-                        )
-
         schedule_cards: List[Dict[str, Any]] = []
 
         for decision in snapshot.schedule_decisions.values():
-            switch_entity = self._schedule_switch_entity(entry_id, decision.schedule_id)
+            switch_entity = self._schedule_switch_entity(entry_slug, decision.schedule_id)
             controlling_devices = schedule_to_devices.get(decision.schedule_id, [])
             controlling_count = len(controlling_devices)
 
-            # Status text
-            if not decision.enabled:
-                status = "Disabled"
-            elif decision.is_active and controlling_count > 0:
-                status = "Active"
-            elif decision.is_active:
-                status = "Superseded"
-            elif decision.in_time_window:
-                status = "Window open"
-            else:
-                status = "Idle"
+            # Status text and title marker
+            status, status_icon = _SCHEDULE_STATUS[
+                (
+                    decision.enabled,
+                    decision.is_active,
+                    controlling_count > 0,
+                    decision.in_time_window,
+                )
+            ]
 
             # Time window
             if decision.start_time == decision.end_time:
@@ -486,11 +584,10 @@ class HeatingControlDashboardStrategy(Strategy):
 
             # Temperature condition status
             temp_condition_str = ""
-            temp_condition = getattr(decision, "temp_condition", "always")
-            temp_condition_met = getattr(decision, "temp_condition_met", True)
+            temp_condition = decision.temp_condition
             if temp_condition != "always":
                 condition_label = "Cold only" if temp_condition == "cold" else "Warm only"
-                if temp_condition_met:
+                if decision.temp_condition_met:
                     temp_condition_str = f"{condition_label}: ✓"
                 elif decision.enabled:
                     temp_condition_str = f"{condition_label}: ✗"
@@ -506,29 +603,26 @@ class HeatingControlDashboardStrategy(Strategy):
                 cfg_count = decision.device_count
                 devices_str = f"Configured: {cfg_count} device{'s' if cfg_count != 1 else ''}" if cfg_count else "—"
 
-            # Build card with switch and info
+            # Build card with switch and info; optional rows are skipped when empty
+            text_rows = (
+                ("Time", time_str),
+                ("Status", status),
+                ("Presence", presence_str),
+                ("Temp Condition", temp_condition_str),
+                *(("Mode", mode_line) for mode_line in mode_lines),
+                ("Fan", decision.target_fan),
+                ("Devices", devices_str),
+            )
             card_entities: List[Dict[str, Any]] = [
                 {"entity": switch_entity, "name": "Enabled"},
-                {"type": "text", "name": "Time", "text": time_str},
-                {"type": "text", "name": "Status", "text": status},
+                *(
+                    {"type": "text", "name": row_name, "text": row_text}
+                    for row_name, row_text in text_rows
+                    if row_text
+                ),
             ]
 
-            if presence_str:
-                card_entities.append({"type": "text", "name": "Presence", "text": presence_str})
-
-            if temp_condition_str:
-                card_entities.append({"type": "text", "name": "Temp Condition", "text": temp_condition_str})
-
-            for mode_line in mode_lines:
-                card_entities.append({"type": "text", "name": "Mode", "text": mode_line})
-
-            if decision.target_fan:
-                card_entities.append({"type": "text", "name": "Fan", "text": decision.target_fan})
-
-            card_entities.append({"type": "text", "name": "Devices", "text": devices_str})
-
             # Schedule card with status icon in title
-            status_icon = self._get_schedule_status_icon(decision)
             schedule_cards.append({
                 "type": "entities",
                 "title": f"{status_icon} {decision.name}",
@@ -541,18 +635,15 @@ class HeatingControlDashboardStrategy(Strategy):
 
         column_count = min(max(len(schedule_cards), 1), 3)
 
-        return {
-            "type": "vertical-stack",
-            "cards": [
-                {"type": "markdown", "content": "### Schedules"},
-                {
-                    "type": "grid",
-                    "columns": column_count,
-                    "square": False,
-                    "cards": schedule_cards,
-                },
-            ],
-        }
+        return [
+            {"type": "markdown", "content": "### Schedules"},
+            {
+                "type": "grid",
+                "columns": column_count,
+                "square": False,
+                "cards": schedule_cards,
+            },
+        ]
 
     def _resolve_coordinator(self):
         """Return the coordinator for the requested config entry (or the first available)."""
@@ -570,6 +661,16 @@ class HeatingControlDashboardStrategy(Strategy):
     def _friendly_name(self, entity_id: str) -> str:
         """Return a Home Assistant friendly name for an entity id.
 
+        Resolved once per render; entities referenced from several cards reuse it.
+        """
+        name = self._name_cache.get(entity_id)
+        if name is None:
+            name = self._name_cache[entity_id] = self._resolve_friendly_name(entity_id)
+        return name
+
+    def _resolve_friendly_name(self, entity_id: str) -> str:
+        """Look up a friendly name for an entity id.
+
         Checks multiple sources in order of preference:
         1. State attributes (friendly_name) - most accurate when available
         2. Entity registry (name or original_name) - available at boot before states
@@ -584,24 +685,24 @@ class HeatingControlDashboardStrategy(Strategy):
             state = hass_states.get(entity_id)
             if state:
                 friendly_name = state.attributes.get("friendly_name")
-                if isinstance(friendly_name, str) and friendly_name.strip():
+                if _nonblank_str(friendly_name):
                     return friendly_name
 
                 state_name = getattr(state, "name", None)
-                if isinstance(state_name, str) and state_name.strip():
+                if _nonblank_str(state_name):
                     return state_name
 
         # Try entity registry (available earlier than states at boot)
         try:
-            from homeassistant.helpers import entity_registry as er
-
-            registry = er.async_get(self.hass)
+            registry = self._registry
+            if registry is None:
+                registry = self._registry = er.async_get(self.hass)
             entry = registry.async_get(entity_id)
             if entry:
                 # Prefer user-set name, then original name
-                if entry.name and entry.name.strip():
+                if _nonblank_str(entry.name):
                     return entry.name
-                if entry.original_name and entry.original_name.strip():
+                if _nonblank_str(entry.original_name):
                     return entry.original_name
         except Exception:
             pass  # Entity registry not available or other error
@@ -609,58 +710,58 @@ class HeatingControlDashboardStrategy(Strategy):
         # Fallback to a slugified title when no friendly name is available
         return entity_id.split(".", 1)[-1].replace("_", " ").title()
 
+    @staticmethod
+    def _build_schedule_name_index(
+        snapshot: Optional["HeatingStateSnapshot"],
+    ) -> Dict[str, Optional[str]]:
+        """Map schedule references (mapping key, schedule_id, name) to display names.
+
+        A reference resolves to None when its schedule has no usable name.
+        """
+        if not snapshot or not snapshot.schedule_decisions:
+            return {}
+
+        schedule_names: Dict[str, Optional[str]] = {}
+        direct_names: Dict[str, str] = {}
+        for key, decision in snapshot.schedule_decisions.items():
+            raw_name = decision.name
+            if _nonblank_str(raw_name):
+                decision_name: Optional[str] = raw_name
+                # Direct lookup by mapping key wins over matches on other decisions
+                direct_names[key] = raw_name
+            else:
+                decision_name = None
+            for ref in (decision.schedule_id, raw_name):
+                if ref:
+                    schedule_names.setdefault(ref, decision_name)
+
+        schedule_names.update(direct_names)
+        return schedule_names
+
+    @staticmethod
     def _schedule_display_name(
-        self, snapshot: Optional["HeatingStateSnapshot"], schedule_ref: Optional[str]
+        schedule_names: Dict[str, Optional[str]], schedule_ref: Optional[str]
     ) -> str:
         """Return a friendly name for a schedule using snapshot data when possible."""
         if not schedule_ref:
             return ""
-
-        schedule_decisions = getattr(snapshot, "schedule_decisions", None)
-        if schedule_decisions:
-            # Direct lookup by schedule_id (mapping keys) or by stored name
-            decision = schedule_decisions.get(schedule_ref)
-            if decision:
-                decision_name = getattr(decision, "name", None)
-                if isinstance(decision_name, str) and decision_name.strip():
-                    return decision_name
-
-            for decision in schedule_decisions.values():
-                schedule_id = getattr(decision, "schedule_id", None)
-                decision_name = getattr(decision, "name", None)
-                if schedule_ref in (schedule_id, decision_name):
-                    if isinstance(decision_name, str) and decision_name.strip():
-                        return decision_name
-                    break
-
-        return schedule_ref
-
-    def _get_schedule_status_icon(self, decision) -> str:
-        """Return a status marker for a schedule based on its current state."""
-        if not decision.enabled:
-            return STATUS_OFF
-        elif decision.is_active:
-            return STATUS_ON
-        elif decision.in_time_window:
-            return STATUS_WAIT
-        else:
-            return ""
+        return schedule_names.get(schedule_ref) or schedule_ref
 
     @staticmethod
-    def _schedule_switch_entity(entry_id: str, schedule_id: str) -> str:
-        """Return the switch entity id for toggling a schedule."""
+    def _schedule_switch_entity(entry_slug: str, schedule_id: str) -> str:
+        """Return the switch entity id for toggling a schedule (entry id already slugified)."""
         return SCHEDULE_SWITCH_ENTITY_TEMPLATE.format(
-            entry=slugify(entry_id),
-            schedule=slugify(schedule_id),
+            entry=entry_slug,
+            schedule=_cached_slugify(schedule_id),
         )
 
     @staticmethod
-    def _device_switch_entity(entry_id: str, device_entity_id: str) -> str:
-        """Return the switch entity id for enabling/disabling a device."""
+    def _device_switch_entity(entry_slug: str, device_entity_id: str) -> str:
+        """Return the switch entity id for enabling/disabling a device (entry id already slugified)."""
         # Extract device name from entity_id (e.g., climate.bedroom_ac -> bedroom_ac)
-        device_slug = slugify(device_entity_id.replace("climate.", ""))
+        device_slug = _cached_slugify(device_entity_id.replace("climate.", ""))
         return DEVICE_SWITCH_ENTITY_TEMPLATE.format(
-            entry=slugify(entry_id),
+            entry=entry_slug,
             device=device_slug,
         )
 
@@ -690,11 +791,15 @@ class HeatingControlDashboardStrategy(Strategy):
         }
 
     @staticmethod
-    def _get_config_list(coordinator, key: str) -> Sequence[str]:
-        """Return a list configuration value (options preferred over data)."""
-        options = coordinator.config_entry.options
-        if key in options:
-            value = options.get(key)
-            return value if value is not None else []
-        data = coordinator.config_entry.data
-        return data.get(key, [])
+    def _get_config_lists(config_entry, *keys: str) -> Tuple[Sequence[str], ...]:
+        """Return list configuration values (options preferred over data) for each key."""
+        options = config_entry.options
+        data = config_entry.data
+        values: List[Sequence[str]] = []
+        for key in keys:
+            if key in options:
+                value = options[key]
+                values.append(value if value is not None else [])
+            else:
+                values.append(data.get(key, []))
+        return tuple(values)
@@ -0,0 +1,21 @@
+"""Helpers shared by the Heating Control coordinator, config flow and entities."""
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from .const import CONF_SCHEDULE_ID, CONF_SCHEDULE_NAME
+
+__all__ = ["schedule_key"]
+
+
+def schedule_key(schedule: Mapping[str, Any], index: int) -> str:
+    """Return the identifier used for a schedule in decisions and overrides.
+
+    Schedule switches store their state in ``CONF_SCHEDULE_OVERRIDES`` under
+    this key, so every reader and writer of the overrides must derive it here.
+    """
+    return (
+        schedule.get(CONF_SCHEDULE_ID)
+        or schedule.get(CONF_SCHEDULE_NAME)
+        or f"schedule_{index}"
+    )
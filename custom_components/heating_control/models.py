@@ -12,7 +12,7 @@ __all__ = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScheduleDecision:
     """Decision data for an individual schedule.
 
@@ -89,7 +89,7 @@ class ScheduleDecision:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeviceDecision:
     """Decision data for an individual climate device.
 
@@ -121,7 +121,7 @@ class DeviceDecision:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiagnosticsSnapshot:
     """Diagnostics information about the current coordinator decision state.
 
@@ -174,7 +174,7 @@ class DiagnosticsSnapshot:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HeatingStateSnapshot:
     """Complete state snapshot calculated by the coordinator.
 
@@ -19,7 +19,6 @@ from .const import (
     CONF_DISABLED_DEVICES,
     CONF_SCHEDULES,
     CONF_SCHEDULE_DEVICES,
-    CONF_SCHEDULE_ENABLED,
     CONF_SCHEDULE_END,
     CONF_SCHEDULE_HVAC_MODE,
     CONF_SCHEDULE_AWAY_HVAC_MODE,
@@ -302,11 +301,8 @@ class ScheduleEnableSwitch(BaseEnableSwitch):
         return snapshot.schedule_decisions.get(self._schedule_id)
 
     def _config_schedule_enabled(self) -> Optional[bool]:
-        """Return the enabled state from stored config."""
-        schedule = self._get_config_schedule()
-        if not schedule:
-            return None
-        return schedule.get(CONF_SCHEDULE_ENABLED, True)
+        """Return the enabled state from stored config, including toggle overrides."""
+        return self.coordinator.get_schedule_enabled(self._schedule_id, self._fallback_name)
 
     def _get_config_schedule(self) -> Optional[Dict[str, Any]]:
         """Return the schedule config from entry data/options.
@@ -326,7 +322,7 @@ class ScheduleEnableSwitch(BaseEnableSwitch):
             schedules = self.coordinator.config.get(CONF_SCHEDULES, [])
             fallback_name_lower = self._fallback_name.casefold()
             for sched in schedules:
-                if sched.get(CONF_SCHEDULE_NAME, "").casefold() == fallback_name_lower:
+                if (sched.get(CONF_SCHEDULE_NAME) or "").casefold() == fallback_name_lower:
                     schedule = sched
                     break
 
@@ -2,6 +2,7 @@ import asyncio
 from dataclasses import dataclass
 import sys
 import types
+from types import SimpleNamespace
 from typing import Any, Dict, Optional
 
 import pytest
@@ -79,6 +80,42 @@ class DummyHass:
         return func(*args, **kwargs)
 
 
+def make_coordinator(hass: DummyHass, config: Optional[Dict[str, Any]] = None):
+    """Return a coordinator over ``config`` without DataUpdateCoordinator setup."""
+    from custom_components.heating_control.const import (
+        DEFAULT_FINAL_SETTLE,
+        DEFAULT_SETTLE_SECONDS,
+    )
+    from custom_components.heating_control.controller import ClimateController
+    from custom_components.heating_control.coordinator import HeatingControlCoordinator
+
+    coordinator = HeatingControlCoordinator.__new__(HeatingControlCoordinator)
+    coordinator.hass = hass
+    coordinator.config_entry = SimpleNamespace(options=None, data=config or {})
+    coordinator._controller = ClimateController(
+        hass,
+        settle_seconds=DEFAULT_SETTLE_SECONDS,
+        final_settle=DEFAULT_FINAL_SETTLE,
+    )
+    coordinator._previous_schedule_states = None
+    coordinator._previous_presence_state = None
+    coordinator._previous_outdoor_temp_state = None
+    coordinator._force_update = False
+    coordinator._last_calc_key = None
+    coordinator._last_calc_snapshot = None
+    coordinator._derived_config_source = None
+    coordinator._prepared_schedules = ()
+    coordinator._schedule_index = ({}, {}, {})
+    coordinator._global_trackers = ()
+    coordinator._presence_entities = ()
+    coordinator._schedule_edges = ()
+    coordinator._refresh_requested = False
+    coordinator._queued_refresh = None
+    coordinator._track_schedule_edges = False
+    coordinator._unsub_edge_refresh = None
+    return coordinator
+
+
 @pytest.fixture
 def dummy_hass():
     return DummyHass()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime as real_datetime
 from types import SimpleNamespace
 
 import pytest
+from homeassistant.core import HomeAssistant
 
 import custom_components.heating_control.coordinator as coordinator_module
 from custom_components.heating_control.const import (
@@ -23,39 +25,21 @@ from custom_components.heating_control.const import (
     CONF_SCHEDULE_AWAY_TEMPERATURE,
     CONF_SCHEDULE_NAME,
     CONF_SCHEDULE_ONLY_WHEN_HOME,
+    CONF_SCHEDULE_OVERRIDES,
     CONF_SCHEDULE_START,
     CONF_SCHEDULE_TEMP_CONDITION,
     CONF_SCHEDULE_TEMPERATURE,
-    DEFAULT_FINAL_SETTLE,
     DEFAULT_OUTDOOR_TEMP_HYSTERESIS,
     DEFAULT_OUTDOOR_TEMP_THRESHOLD,
     DEFAULT_SCHEDULE_FAN_MODE,
     DEFAULT_SCHEDULE_HVAC_MODE,
     DEFAULT_SCHEDULE_TEMPERATURE,
-    DEFAULT_SETTLE_SECONDS,
     TEMP_CONDITION_ALWAYS,
     TEMP_CONDITION_COLD,
     TEMP_CONDITION_WARM,
 )
-from custom_components.heating_control.controller import ClimateController
 from custom_components.heating_control.coordinator import HeatingControlCoordinator
-from tests.conftest import DummyState, DummyHass
-
-
-def make_coordinator(hass: DummyHass, config: dict) -> HeatingControlCoordinator:
-    coordinator = HeatingControlCoordinator.__new__(HeatingControlCoordinator)
-    coordinator.hass = hass
-    coordinator.config_entry = SimpleNamespace(options=None, data=config)
-    coordinator._controller = ClimateController(
-        hass,
-        settle_seconds=DEFAULT_SETTLE_SECONDS,
-        final_settle=DEFAULT_FINAL_SETTLE,
-    )
-    coordinator._previous_schedule_states = None
-    coordinator._previous_presence_state = None
-    coordinator._previous_outdoor_temp_state = None
-    coordinator._force_update = False
-    return coordinator
+from tests.conftest import DummyState, DummyHass, make_coordinator
 
 
 def freeze_time(monkeypatch, hour: int, minute: int):
@@ -167,6 +151,31 @@ def test_schedule_activation_without_trackers_defaults_to_home(monkeypatch, dumm
     assert result.diagnostics.trackers_home == 0
 
 
+def test_schedule_with_null_name_is_evaluated(monkeypatch, dummy_hass: DummyHass):
+    freeze_time(monkeypatch, 7, 30)
+
+    schedule = base_schedule(
+        "Morning",
+        "06:00",
+        "09:00",
+        only_when_home=False,
+        devices=["climate.living_room"],
+    )
+    schedule[CONF_SCHEDULE_NAME] = None
+    config = {
+        CONF_AUTO_HEATING_ENABLED: True,
+        CONF_DEVICE_TRACKERS: [],
+        CONF_CLIMATE_DEVICES: ["climate.living_room"],
+        CONF_SCHEDULES: [schedule],
+    }
+
+    coordinator = make_coordinator(dummy_hass, config)
+    result = coordinator._calculate_heating_state()
+
+    assert result.schedule_decisions["Morning"].is_active is True
+    assert result.device_decisions["climate.living_room"].hvac_mode == "heat"
+
+
 def test_off_schedule_turns_device_off(monkeypatch, dummy_hass: DummyHass):
     freeze_time(monkeypatch, 12, 0)
 
@@ -349,6 +358,43 @@ def test_last_schedule_wins(monkeypatch, dummy_hass: DummyHass):
     assert kitchen.active_schedules == ("Dinner Boost",)
 
 
+def test_enabled_override_takes_precedence_over_schedule_flag(monkeypatch, dummy_hass: DummyHass):
+    freeze_time(monkeypatch, 19, 0)
+
+    config = {
+        CONF_AUTO_HEATING_ENABLED: True,
+        CONF_DEVICE_TRACKERS: [],
+        CONF_CLIMATE_DEVICES: ["climate.kitchen"],
+        CONF_SCHEDULES: [
+            base_schedule(
+                "Evening Comfort",
+                "18:00",
+                "22:00",
+                enabled=False,
+                devices=["climate.kitchen"],
+                temperature=21.0,
+            ),
+            base_schedule(
+                "Dinner Boost",
+                "19:00",
+                "21:00",
+                devices=["climate.kitchen"],
+                temperature=19.0,
+            ),
+        ],
+        CONF_SCHEDULE_OVERRIDES: {"Evening Comfort": True, "Dinner Boost": False},
+    }
+
+    coordinator = make_coordinator(dummy_hass, config)
+    result = coordinator._calculate_heating_state()
+
+    assert result.schedule_decisions["Evening Comfort"].enabled is True
+    assert result.schedule_decisions["Dinner Boost"].enabled is False
+    kitchen = result.device_decisions["climate.kitchen"]
+    assert kitchen.target_temp == 21.0
+    assert kitchen.active_schedules == ("Evening Comfort",)
+
+
 def test_midnight_schedule_precedence(monkeypatch, dummy_hass: DummyHass):
     freeze_time(monkeypatch, 0, 30)
 
@@ -469,6 +515,160 @@ def test_single_schedule_without_end_runs_24_7(monkeypatch, dummy_hass: DummyHas
     assert overnight_decision.target_temp == 20.5
 
 
+def test_auto_end_times_recomputed_only_on_config_change(monkeypatch, dummy_hass: DummyHass):
+    """Derived end times are cached until the config entry mapping is replaced."""
+    freeze_time(monkeypatch, 10, 0)
+    config = {
+        CONF_AUTO_HEATING_ENABLED: True,
+        CONF_DEVICE_TRACKERS: [],
+        CONF_CLIMATE_DEVICES: ["climate.bedroom"],
+        CONF_SCHEDULES: [
+            base_schedule("Morning", "08:00", None, devices=["climate.bedroom"]),
+            base_schedule("Evening", "18:00", None, devices=["climate.bedroom"]),
+        ],
+    }
+    coordinator = make_coordinator(dummy_hass, config)
+
+    calls = []
+    original = HeatingControlCoordinator._derive_auto_end_times
+
+    def counting_derive(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(coordinator, "_derive_auto_end_times", counting_derive)
+
+    coordinator._calculate_heating_state()
+    state = coordinator._calculate_heating_state()
+    assert len(calls) == 1
+    assert state.schedule_decisions["Morning"].end_time == "18:00"
+
+    # A config entry update swaps in a new mapping, which invalidates the cache
+    coordinator.config_entry = SimpleNamespace(
+        options=None,
+        data={**config, CONF_SCHEDULE_OVERRIDES: {"Evening": False}},
+    )
+    state = coordinator._calculate_heating_state()
+    assert len(calls) == 2
+    assert state.schedule_decisions["Morning"].end_time == "08:00"
+
+
+def test_snapshot_reused_until_inputs_change(monkeypatch, dummy_hass: DummyHass):
+    freeze_time(monkeypatch, 7, 30)
+    dummy_hass.states.set("device_tracker.user1", DummyState("home", {}))
+    config = {
+        CONF_DEVICE_TRACKERS: ["device_tracker.user1"],
+        CONF_CLIMATE_DEVICES: ["climate.living_room"],
+        CONF_SCHEDULES: [
+            base_schedule("Morning", "06:00", "09:00", devices=["climate.living_room"])
+        ],
+    }
+    coordinator = make_coordinator(dummy_hass, config)
+
+    first = coordinator._calculate_heating_state()
+    assert coordinator._calculate_heating_state() is first
+
+    dummy_hass.states.set("device_tracker.user1", DummyState("not_home", {}))
+    after_presence = coordinator._calculate_heating_state()
+    assert after_presence is not first
+    assert after_presence.anyone_home is False
+
+    freeze_time(monkeypatch, 7, 31)
+    assert coordinator._calculate_heating_state() is not after_presence
+
+
+def test_schedule_edge_refresh_targets_next_start_or_end(monkeypatch, dummy_hass: DummyHass):
+    freeze_time(monkeypatch, 22, 30)
+    disabled = base_schedule("Disabled", "23:00", "23:15")
+    disabled[CONF_SCHEDULE_ENABLED] = False
+    config = {
+        CONF_CLIMATE_DEVICES: [],
+        CONF_SCHEDULES: [
+            base_schedule("Morning", "06:00", "09:00"),
+            base_schedule("Night", "21:00", "23:45"),
+            disabled,
+        ],
+    }
+    coordinator = make_coordinator(dummy_hass, config)
+
+    delays = []
+    actions = []
+
+    def _call_later(hass, delay, action):
+        delays.append(delay)
+        actions.append(action)
+        return lambda: None
+
+    monkeypatch.setattr(coordinator_module, "async_call_later", _call_later)
+
+    stop = coordinator.async_track_schedule_edges()
+    assert delays == [75 * 60]  # Night ends at 23:45; the disabled schedule is ignored
+
+    freeze_time(monkeypatch, 23, 50)
+    coordinator._schedule_next_edge_refresh()
+    assert delays[-1] == (6 * 60 + 10) * 60  # Wraps to Morning's start
+
+    requested = []
+
+    def _create_task(coro):
+        requested.append(coro)
+        coro.close()
+        return SimpleNamespace(done=lambda: False)
+
+    dummy_hass.async_create_task = _create_task
+
+    # The edge queues a refresh, so one landing mid-refresh is not dropped
+    actions[-1](None)
+    assert len(requested) == 1
+    assert coordinator._refresh_requested is True
+
+    stop()
+    assert coordinator._unsub_edge_refresh is None
+
+
+def test_get_schedule_by_id_matches_id_or_casefolded_name(dummy_hass: DummyHass):
+    morning = base_schedule("Morning", "08:00", "10:00")
+    morning["id"] = "abc123"
+    evening = base_schedule("Evening", "18:00", "22:00")
+    config = {CONF_CLIMATE_DEVICES: [], CONF_SCHEDULES: [morning, evening]}
+
+    coordinator = make_coordinator(dummy_hass, config)
+
+    assert coordinator.get_schedule_by_id("abc123") is morning
+    assert coordinator.get_schedule_by_id("EVENING") is evening
+    assert coordinator.get_schedule_by_id("missing") is None
+
+
+def test_get_schedule_enabled_applies_overrides(dummy_hass: DummyHass):
+    morning = base_schedule("Morning", "08:00", "10:00")
+    morning["id"] = "abc123"
+    evening = base_schedule("Evening", "18:00", "22:00")
+    config = {
+        CONF_CLIMATE_DEVICES: [],
+        CONF_SCHEDULES: [morning, evening],
+        CONF_SCHEDULE_OVERRIDES: {"abc123": False},
+    }
+
+    coordinator = make_coordinator(dummy_hass, config)
+
+    assert coordinator.get_schedule_enabled("abc123") is False
+    assert coordinator.get_schedule_enabled("evening") is True
+    assert coordinator.get_schedule_enabled("renamed", "MORNING") is False
+    assert coordinator.get_schedule_enabled("missing") is None
+
+
+def test_get_schedule_by_id_prefers_earliest_match(dummy_hass: DummyHass):
+    first = base_schedule("abc123", "06:00", "07:00")
+    second = base_schedule("Second", "08:00", "10:00")
+    second["id"] = "abc123"
+    config = {CONF_CLIMATE_DEVICES: [], CONF_SCHEDULES: [first, second]}
+
+    coordinator = make_coordinator(dummy_hass, config)
+
+    # A name match earlier in the list wins over a later ID match, as in a scan
+    assert coordinator.get_schedule_by_id("abc123") is first
+
+
 def test_daily_schedule_flow(monkeypatch, dummy_hass: DummyHass):
     dummy_hass.states.set("device_tracker.family", DummyState("home", {}))
 
@@ -1052,6 +1252,129 @@ def test_schedule_with_valid_per_schedule_trackers_not_home(monkeypatch, dummy_h
     assert morning_decision.hvac_mode == "off"  # But uses away/off mode since nobody home
 
 
+def test_tracker_states_fetched_once_per_cycle(monkeypatch, dummy_hass: DummyHass):
+    """Trackers shared by global and per-schedule presence are queried once."""
+    freeze_time(monkeypatch, 7, 30)
+    dummy_hass.states.set("device_tracker.user1", DummyState("home", {}))
+
+    lookups: list[str] = []
+    original_get = dummy_hass.states.get
+
+    def counting_get(entity_id):
+        lookups.append(entity_id)
+        return original_get(entity_id)
+
+    monkeypatch.setattr(dummy_hass.states, "get", counting_get)
+
+    schedules = []
+    for name in ("Morning", "Breakfast"):
+        schedule = base_schedule(name, "07:00", "09:00", devices=["climate.bedroom"])
+        schedule[CONF_SCHEDULE_DEVICE_TRACKERS] = ["device_tracker.user1"]
+        schedules.append(schedule)
+
+    config = {
+        CONF_AUTO_HEATING_ENABLED: True,
+        CONF_CLIMATE_DEVICES: ["climate.bedroom"],
+        CONF_DEVICE_TRACKERS: ["device_tracker.user1"],
+        CONF_SCHEDULES: schedules,
+    }
+
+    coordinator = make_coordinator(dummy_hass, config)
+    result = coordinator._calculate_heating_state()
+
+    assert result.schedule_decisions["Morning"].presence_ok is True
+    assert result.schedule_decisions["Breakfast"].presence_ok is True
+    assert lookups.count("device_tracker.user1") == 1
+
+
+def test_presence_listener_targets_trackers_and_coalesces_refreshes(dummy_hass: DummyHass):
+    schedule = base_schedule("Morning", "07:00", "09:00")
+    schedule[CONF_SCHEDULE_DEVICE_TRACKERS] = ["device_tracker.specific_user", ""]
+    config = {
+        CONF_CLIMATE_DEVICES: [],
+        CONF_DEVICE_TRACKERS: ["device_tracker.user1", None],
+        CONF_SCHEDULES: [schedule],
+    }
+    coordinator = make_coordinator(dummy_hass, config)
+
+    assert coordinator._get_presence_entities() == {
+        "device_tracker.user1",
+        "device_tracker.specific_user",
+    }
+
+    requested = []
+
+    pending = SimpleNamespace(done=lambda: False)
+
+    def _create_task(coro):
+        requested.append(coro)
+        coro.close()
+        return pending
+
+    dummy_hass.async_create_task = _create_task
+
+    home = DummyState("home", {})
+    away = DummyState("not_home", {})
+    coordinator._handle_presence_change(
+        SimpleNamespace(data={"old_state": home, "new_state": DummyState("home", {"gps": 1})})
+    )
+    assert requested == []
+
+    coordinator._handle_presence_change(SimpleNamespace(data={"old_state": home, "new_state": away}))
+    assert len(requested) == 1
+
+    # A second tracker changing while the refresh is pending reuses it, and
+    # makes it run again if the refresh already read the trackers
+    coordinator._refresh_requested = False
+    coordinator._handle_presence_change(SimpleNamespace(data={"old_state": home, "new_state": away}))
+    assert len(requested) == 1
+    assert coordinator._refresh_requested is True
+
+    pending.done = lambda: True
+    coordinator._handle_presence_change(SimpleNamespace(data={"old_state": away, "new_state": home}))
+    assert len(requested) == 2
+
+
+def test_outdoor_listener_refreshes_only_on_hysteresis_flip(dummy_hass: DummyHass):
+    config = {
+        CONF_CLIMATE_DEVICES: [],
+        CONF_OUTDOOR_TEMP_SENSOR: "sensor.outdoor_temp",
+        CONF_OUTDOOR_TEMP_THRESHOLD: 5.0,
+        CONF_SCHEDULES: [],
+    }
+    coordinator = make_coordinator(dummy_hass, config)
+    coordinator._previous_outdoor_temp_state = "cold"
+
+    requested = []
+
+    def _create_task(coro):
+        requested.append(coro)
+        coro.close()
+        return SimpleNamespace(done=lambda: True)
+
+    dummy_hass.async_create_task = _create_task
+
+    def _reading(old: str, new: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            data={
+                "entity_id": "sensor.outdoor_temp",
+                "old_state": DummyState(old, {}),
+                "new_state": DummyState(new, {}),
+            }
+        )
+
+    # Still cold: below threshold + hysteresis
+    coordinator._handle_presence_change(_reading("3.0", "5.5"))
+    assert requested == []
+
+    coordinator._handle_presence_change(_reading("5.5", "6.0"))
+    assert len(requested) == 1
+
+    # An unavailable sensor falls back to warm, so it only refreshes when cold
+    coordinator._previous_outdoor_temp_state = "warm"
+    coordinator._handle_presence_change(_reading("6.0", "unavailable"))
+    assert len(requested) == 1
+
 
 # ────────────────────────────────────────────────────────────────────────────
 # Outdoor temperature condition tests
@@ -1090,6 +1413,120 @@ def test_cold_schedule_active_when_outdoor_temp_below_threshold(monkeypatch, dum
     assert result.diagnostics.outdoor_temp_state == "cold"
 
 
+def test_watchdog_diagnostics_preserve_outdoor_temperature(monkeypatch, dummy_hass):
+    """Watchdog enrichment only touches watchdog fields of the diagnostics."""
+    freeze_time(monkeypatch, 8, 0)
+    dummy_hass.states.set("sensor.outdoor_temp", DummyState("3.0", {}))
+
+    coordinator = make_coordinator(dummy_hass, _outdoor_config([]))
+    coordinator._last_update_duration = 1.5
+    coordinator._timed_out_devices = {"climate.bedroom"}
+    coordinator._update_cycle_timed_out = False
+
+    snapshot = coordinator._calculate_heating_state()
+    enriched = coordinator._add_watchdog_diagnostics(snapshot)
+
+    assert enriched.diagnostics.outdoor_temp == 3.0
+    assert enriched.diagnostics.outdoor_temp_state == "cold"
+    assert enriched.diagnostics.last_update_duration == 1.5
+    assert enriched.diagnostics.timed_out_devices == ("climate.bedroom",)
+    assert enriched.diagnostics.watchdog_status == "timeout"
+    assert enriched.device_decisions is snapshot.device_decisions
+
+
+@pytest.mark.asyncio
+async def test_control_error_keeps_snapshot_and_retries(monkeypatch, dummy_hass):
+    """An unexpected controller error is logged, not turned into a failed update."""
+    freeze_time(monkeypatch, 7, 30)
+    config = {
+        CONF_CLIMATE_DEVICES: ["climate.living_room"],
+        CONF_SCHEDULES: [
+            base_schedule("Morning", "06:00", "09:00", devices=["climate.living_room"])
+        ],
+    }
+    coordinator = make_coordinator(dummy_hass, config)
+    coordinator._last_update_duration = 0.1
+    coordinator._timed_out_devices = set()
+    coordinator._update_cycle_timed_out = False
+
+    async def _failing_apply(decisions):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(coordinator._controller, "async_apply", _failing_apply)
+
+    snapshot = await coordinator._async_update_data_internal()
+
+    assert snapshot.schedule_decisions["Morning"].is_active is True
+    assert coordinator._force_update is True
+
+
+@pytest.mark.asyncio
+async def test_rapid_toggles_share_one_refresh(tmp_path):
+    """Back-to-back toggles share one refresh; toggles mid-refresh queue another."""
+    hass = HomeAssistant(str(tmp_path))
+    entry = SimpleNamespace(
+        entry_id="entry",
+        title="Heating Control",
+        domain="heating_control",
+        options={},
+        data={
+            CONF_CLIMATE_DEVICES: [],
+            CONF_SCHEDULES: [
+                base_schedule("Morning", "06:00", "09:00"),
+                base_schedule("Evening", "18:00", "22:00"),
+            ],
+        },
+    )
+
+    def _update_entry(config_entry, *, data=None, options=None):
+        if data is not None:
+            config_entry.data = data
+        if options is not None:
+            config_entry.options = options
+
+    hass.config_entries = SimpleNamespace(async_update_entry=_update_entry)
+    coordinator = HeatingControlCoordinator(hass, entry)
+    coordinator.config_entry = entry
+
+    update_calls = []
+    refresh_started = asyncio.Event()
+    release_refresh = asyncio.Event()
+    release_refresh.set()
+
+    async def _update_data():
+        update_calls.append(coordinator.config[CONF_SCHEDULE_OVERRIDES])
+        refresh_started.set()
+        await release_refresh.wait()
+        return None
+
+    coordinator._async_update_data = _update_data
+
+    try:
+        await coordinator.async_set_schedule_enabled(schedule_id="Morning", enabled=False)
+        await coordinator.async_set_schedule_enabled(schedule_id="Evening", enabled=False)
+        await hass.async_block_till_done()
+
+        # One refresh ran, and it already saw both toggles
+        assert update_calls == [{"Morning": False, "Evening": False}]
+        assert coordinator._soft_update_count == 0
+
+        # A toggle while a refresh is running is applied by one more refresh
+        refresh_started.clear()
+        release_refresh.clear()
+        await coordinator.async_set_schedule_enabled(schedule_id="Morning", enabled=True)
+        await refresh_started.wait()
+        await coordinator.async_set_schedule_enabled(schedule_id="Evening", enabled=True)
+        release_refresh.set()
+        await hass.async_block_till_done()
+
+        # (re-enabling a schedule drops its override)
+        assert update_calls[1:] == [{"Evening": False}, {}]
+        assert coordinator._soft_update_count == 0
+    finally:
+        await coordinator.async_shutdown()
+        await hass.async_stop(force=True)
+
+
 def test_cold_schedule_inactive_when_outdoor_temp_above_threshold(monkeypatch, dummy_hass):
     """Cold schedule should be inactive when outdoor temp >= threshold."""
     freeze_time(monkeypatch, 8, 0)
@@ -1,8 +1,14 @@
+import asyncio
+
 import pytest
 
 from custom_components.heating_control.controller import ClimateController
 from custom_components.heating_control.models import DeviceDecision
-from custom_components.heating_control.const import DEFAULT_FINAL_SETTLE, DEFAULT_SETTLE_SECONDS
+from custom_components.heating_control.const import (
+    DEFAULT_FINAL_SETTLE,
+    DEFAULT_SETTLE_SECONDS,
+    SETTLE_MIN_SECONDS,
+)
 from tests.conftest import DummyHass, DummyState
 
 
@@ -137,6 +143,22 @@ async def test_no_changes_no_calls(dummy_hass: DummyHass, no_sleep):
     assert dummy_hass.services.calls == []
 
 
+@pytest.mark.asyncio
+async def test_skips_commands_device_already_reflects(dummy_hass: DummyHass, no_sleep):
+    dummy_hass.states.set(
+        "climate.kitchen",
+        DummyState("heat", {"fan_modes": ["auto", "high"], "temperature": 20.0, "fan_mode": "auto"}),
+    )
+    controller = make_controller(dummy_hass)
+
+    # No history yet: only the fan differs from the live state
+    await controller.async_apply([
+        _decision("climate.kitchen", hvac_mode="heat", temp=20.0, fan="high")
+    ])
+
+    assert [call["service"] for call in dummy_hass.services.calls] == ["set_fan_mode"]
+
+
 @pytest.mark.asyncio
 async def test_fan_mode_not_supported(dummy_hass: DummyHass, no_sleep):
     dummy_hass.states.set(
@@ -256,3 +278,60 @@ async def test_dry_mode_skips_temperature(dummy_hass: DummyHass, no_sleep):
         for call in services
     )
     assert not any(call["service"] == "set_temperature" for call in services)
+
+
+@pytest.mark.asyncio
+async def test_devices_settle_concurrently(dummy_hass: DummyHass, monkeypatch):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _sleep(_):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await real_sleep(0)
+        in_flight -= 1
+
+    real_sleep = asyncio.sleep
+    monkeypatch.setattr("custom_components.heating_control.controller.asyncio.sleep", _sleep)
+
+    for entity_id in ("climate.kitchen", "climate.bedroom"):
+        dummy_hass.states.set(entity_id, DummyState("off", {}))
+    controller = make_controller(dummy_hass)
+
+    await controller.async_apply([
+        _decision("climate.kitchen", hvac_mode="heat", temp=21.0, fan="auto"),
+        _decision("climate.bedroom", hvac_mode="heat", temp=19.0, fan="auto"),
+    ])
+
+    assert max_in_flight == 2
+    assert len(dummy_hass.services.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_settle_ends_once_device_reports_mode(dummy_hass: DummyHass, monkeypatch):
+    sleeps = []
+
+    async def _sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("custom_components.heating_control.controller.asyncio.sleep", _sleep)
+
+    dummy_hass.states.set("climate.kitchen", DummyState("off", {}))
+    record_call = dummy_hass.services.async_call
+
+    async def _acknowledging_call(domain, service, data, blocking=False):
+        await record_call(domain, service, data, blocking)
+        if service == "set_hvac_mode":
+            dummy_hass.states.set(data["entity_id"], DummyState(data["hvac_mode"], {}))
+
+    monkeypatch.setattr(dummy_hass.services, "async_call", _acknowledging_call)
+    controller = make_controller(dummy_hass)
+
+    await controller.async_apply([
+        _decision("climate.kitchen", hvac_mode="heat", temp=21.0, fan="auto")
+    ])
+
+    # Minimum settle only, then the full final settle after the mode change
+    assert sleeps == [SETTLE_MIN_SECONDS, DEFAULT_FINAL_SETTLE]
+    assert dummy_hass.services.calls[0]["service"] == "set_hvac_mode"
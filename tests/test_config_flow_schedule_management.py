@@ -26,7 +26,11 @@ import pytest
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-from custom_components.heating_control.config_flow import HeatingControlOptionsFlow
+from custom_components.heating_control.config_flow import (
+    HeatingControlOptionsFlow,
+    _apply_schedule_overrides,
+    _detect_schedule_overlaps,
+)
 from custom_components.heating_control.const import (
     CONF_AUTO_HEATING_ENABLED,
     CONF_CLIMATE_DEVICES,
@@ -38,10 +42,12 @@ from custom_components.heating_control.const import (
     CONF_SCHEDULE_END,
     CONF_SCHEDULE_FAN_MODE,
     CONF_SCHEDULE_HVAC_MODE,
+    CONF_SCHEDULE_ID,
     CONF_SCHEDULE_AWAY_HVAC_MODE,
     CONF_SCHEDULE_AWAY_TEMPERATURE,
     CONF_SCHEDULE_NAME,
     CONF_SCHEDULE_ONLY_WHEN_HOME,
+    CONF_SCHEDULE_OVERRIDES,
     CONF_SCHEDULE_START,
     CONF_SCHEDULE_TEMPERATURE,
     DEFAULT_SCHEDULE_HVAC_MODE,
@@ -957,3 +963,59 @@ async def test_manage_schedules_with_no_schedules_in_config():
 
     # Check that description indicates no schedules
     assert "No schedules" in result["description_placeholders"]["schedules"]
+
+
+# ============================================================================
+# TESTS: OVERLAP DETECTION
+# ============================================================================
+
+
+def test_detect_schedule_overlaps_only_reports_shared_start_and_devices():
+    """
+    Purpose: Verify overlap warnings need both a shared start time and device.
+
+    Setup: Three schedules at 07:00 (Boost shares a device with each of the
+           others) and one at 08:00 that also controls the bedroom.
+    Assertion: Two warnings, both for 07:00 pairs; the 08:00 schedule is never
+               reported.
+    """
+    schedules = [
+        {CONF_SCHEDULE_NAME: "Wake", CONF_SCHEDULE_START: "07:00",
+         CONF_SCHEDULE_DEVICES: ["climate.bedroom"]},
+        {CONF_SCHEDULE_NAME: "Kitchen", CONF_SCHEDULE_START: "07:00",
+         CONF_SCHEDULE_DEVICES: ["climate.kitchen"]},
+        {CONF_SCHEDULE_NAME: "Late", CONF_SCHEDULE_START: "08:00",
+         CONF_SCHEDULE_DEVICES: ["climate.bedroom"]},
+        {CONF_SCHEDULE_NAME: "Boost", CONF_SCHEDULE_START: "07:00",
+         CONF_SCHEDULE_DEVICES: ["climate.bedroom", "climate.kitchen"]},
+    ]
+
+    warnings = _detect_schedule_overlaps(schedules)
+
+    assert len(warnings) == 2
+    assert "'Wake' and 'Boost'" in warnings[0]
+    assert "bedroom" in warnings[0]
+    assert "'Kitchen' and 'Boost'" in warnings[1]
+    assert all("Late" not in warning for warning in warnings)
+
+
+def test_apply_schedule_overrides_uses_shared_schedule_keys():
+    """
+    Purpose: Verify overrides are matched with the same keys the switches write.
+
+    Setup: One schedule with an ID, one with only a name, one with neither,
+           and overrides keyed by ID, name and positional fallback.
+    Assertion: Every schedule picks up its override.
+    """
+    config = {
+        CONF_SCHEDULES: [
+            {CONF_SCHEDULE_ID: "abc", CONF_SCHEDULE_NAME: "Morning"},
+            {CONF_SCHEDULE_NAME: "Evening"},
+            {CONF_SCHEDULE_START: "22:00"},
+        ],
+        CONF_SCHEDULE_OVERRIDES: {"abc": False, "Evening": False, "schedule_2": False},
+    }
+
+    schedules = _apply_schedule_overrides(config)
+
+    assert [schedule[CONF_SCHEDULE_ENABLED] for schedule in schedules] == [False, False, False]
@@ -7,6 +7,7 @@ import pytest
 from custom_components.heating_control.const import (
     CONF_CLIMATE_DEVICES,
     CONF_DEVICE_TRACKERS,
+    CONF_OUTDOOR_TEMP_SENSOR,
     DOMAIN,
 )
 from custom_components.heating_control.dashboard import HeatingControlDashboardStrategy
@@ -178,20 +179,16 @@ async def test_climate_grid_uses_multiple_columns_when_multiple_devices() -> Non
     assert view.get("panel") is True
     cards = view["cards"][0]["cards"]
 
-    # Find the climate controls section (vertical-stack with markdown header)
-    climate_section = None
-    for card in cards:
-        if card.get("type") == "vertical-stack":
-            inner_cards = card.get("cards", [])
-            if inner_cards and inner_cards[0].get("type") == "markdown":
-                content = inner_cards[0].get("content", "")
-                if "Climate Controls" in content:
-                    climate_section = card
-                    break
-
-    assert climate_section is not None
-    # Second card in the section should be the grid
-    thermostat_grid = climate_section["cards"][1]
+    # Find the climate controls section (markdown header followed by its grid)
+    climate_index = None
+    for i, card in enumerate(cards):
+        if card.get("type") == "markdown" and "Climate Controls" in card.get("content", ""):
+            climate_index = i
+            break
+
+    assert climate_index is not None
+    # The card after the header should be the grid
+    thermostat_grid = cards[climate_index + 1]
     assert thermostat_grid["type"] == "grid"
     assert thermostat_grid["columns"] > 1  # Multiple devices = multiple columns
 
@@ -275,14 +272,12 @@ async def test_device_cards_precede_schedule_cards_in_diagnostics_section() -> N
     device_index = None
     schedule_index = None
     for i, card in enumerate(cards):
-        if card.get("type") == "vertical-stack":
-            inner_cards = card.get("cards", [])
-            if inner_cards and inner_cards[0].get("type") == "markdown":
-                content = inner_cards[0].get("content", "")
-                if "Device Status" in content:
-                    device_index = i
-                elif "Schedules" in content:
-                    schedule_index = i
+        if card.get("type") == "markdown":
+            content = card.get("content", "")
+            if "Device Status" in content:
+                device_index = i
+            elif "Schedules" in content:
+                schedule_index = i
 
     assert device_index is not None, "Device Status section not found"
     assert schedule_index is not None, "Schedules section not found"
@@ -341,3 +336,120 @@ async def test_empty_option_lists_override_data() -> None:
 
     # Second card is status grid (no climate section when no devices)
     assert cards[1]["type"] in ("grid", "vertical-stack")
+
+
+@pytest.mark.asyncio
+async def test_render_reused_until_snapshot_or_names_change() -> None:
+    """Unchanged inputs should return the previously rendered dashboard."""
+    config_entry = DummyConfigEntry(
+        "entry-cache",
+        data={CONF_CLIMATE_DEVICES: ["climate.living_room"]},
+    )
+    coordinator = DummyCoordinator(config_entry, _build_snapshot())
+    states = {
+        "climate.living_room": SimpleNamespace(
+            state="heat", attributes={"friendly_name": "Living Room"}
+        )
+    }
+    hass = _build_hass({"entry-cache": coordinator}, states=states)
+
+    first = await HeatingControlDashboardStrategy(
+        hass, {"entry_id": "entry-cache"}
+    ).async_generate()
+    second = await HeatingControlDashboardStrategy(
+        hass, {"entry_id": "entry-cache"}
+    ).async_generate()
+    assert second is first
+
+    states["climate.living_room"] = SimpleNamespace(
+        state="heat", attributes={"friendly_name": "Lounge"}
+    )
+    renamed = await HeatingControlDashboardStrategy(
+        hass, {"entry_id": "entry-cache"}
+    ).async_generate()
+    assert renamed is not first
+
+    coordinator.data = _build_snapshot(active_schedules=1)
+    refreshed = await HeatingControlDashboardStrategy(
+        hass, {"entry_id": "entry-cache"}
+    ).async_generate()
+    assert refreshed is not renamed
+
+
+def test_schedule_name_index_resolves_ids_and_names() -> None:
+    """Schedule references should resolve by mapping key, id, or name."""
+    snapshot = SimpleNamespace(
+        schedule_decisions={
+            "weekday": SimpleNamespace(schedule_id="weekday", name="Weekday AM"),
+            "unnamed": SimpleNamespace(schedule_id="unnamed", name="  "),
+        }
+    )
+    names = HeatingControlDashboardStrategy._build_schedule_name_index(snapshot)
+    display = HeatingControlDashboardStrategy._schedule_display_name
+
+    assert display(names, "weekday") == "Weekday AM"
+    assert display(names, "Weekday AM") == "Weekday AM"
+    assert display(names, "unnamed") == "unnamed"
+    assert display(names, "missing") == "missing"
+    assert display(names, None) == ""
+
+
+@pytest.mark.asyncio
+async def test_strategy_waits_for_first_snapshot() -> None:
+    """Before the first coordinator update a short message should be returned."""
+    config_entry = DummyConfigEntry(
+        "entry-pending",
+        options={CONF_CLIMATE_DEVICES: ["climate.living_room"]},
+    )
+    coordinator = DummyCoordinator(config_entry, None)
+    hass = _build_hass({"entry-pending": coordinator})
+    strategy = HeatingControlDashboardStrategy(hass, {"entry_id": "entry-pending"})
+
+    result = await strategy.async_generate()
+
+    message_card = result["views"][0]["sections"][0]["cards"][0]
+    assert message_card["type"] == "markdown"
+    assert "starting up" in message_card["content"]
+
+
+@pytest.mark.asyncio
+async def test_outdoor_button_follows_master_switch() -> None:
+    """A configured outdoor sensor adds a sixth button right after the master switch."""
+    config_entry = DummyConfigEntry(
+        "entry-outdoor",
+        options={CONF_OUTDOOR_TEMP_SENSOR: "sensor.outdoor_temperature"},
+    )
+    coordinator = DummyCoordinator(config_entry, _build_snapshot())
+    hass = _build_hass({"entry-outdoor": coordinator})
+    strategy = HeatingControlDashboardStrategy(hass, {"entry_id": "entry-outdoor"})
+
+    result = await strategy.async_generate()
+
+    status_grid = result["views"][0]["cards"][0]["cards"][1]
+    assert status_grid["type"] == "grid"
+    assert status_grid["columns"] == 6
+    assert status_grid["cards"][1]["entity"] == "sensor.outdoor_temperature"
+
+
+@pytest.mark.asyncio
+async def test_button_templates_do_not_share_nested_dicts() -> None:
+    """Each render gets its own tap_action dicts, so edits cannot leak across dashboards."""
+    coordinators = {
+        entry_id: DummyCoordinator(DummyConfigEntry(entry_id), _build_snapshot())
+        for entry_id in ("entry-a", "entry-b")
+    }
+    hass = _build_hass(coordinators)
+
+    grids = []
+    for entry_id in coordinators:
+        strategy = HeatingControlDashboardStrategy(hass, {"entry_id": entry_id})
+        result = await strategy.async_generate()
+        grids.append(result["views"][0]["cards"][0]["cards"][1])
+
+    first_refresh, second_refresh = (grid["cards"][-1] for grid in grids)
+    assert first_refresh["tap_action"] == second_refresh["tap_action"]
+    assert first_refresh["tap_action"] is not second_refresh["tap_action"]
+    assert first_refresh["tap_action"]["data"] is not second_refresh["tap_action"]["data"]
+
+    first_refresh["tap_action"]["data"]["entity_id"] = "sensor.other"
+    assert second_refresh["tap_action"]["data"]["entity_id"] != "sensor.other"
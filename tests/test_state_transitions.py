@@ -1,30 +1,9 @@
-from types import SimpleNamespace
-
-from custom_components.heating_control.const import DEFAULT_FINAL_SETTLE, DEFAULT_SETTLE_SECONDS
-from custom_components.heating_control.controller import ClimateController
-from custom_components.heating_control.coordinator import HeatingControlCoordinator
 from custom_components.heating_control.models import (
     DiagnosticsSnapshot,
     HeatingStateSnapshot,
     ScheduleDecision,
 )
-from tests.conftest import DummyHass
-
-
-def make_coordinator() -> HeatingControlCoordinator:
-    coordinator = HeatingControlCoordinator.__new__(HeatingControlCoordinator)
-    coordinator.hass = DummyHass()
-    coordinator.config_entry = SimpleNamespace(options=None, data={})
-    coordinator._controller = ClimateController(
-        coordinator.hass,
-        settle_seconds=DEFAULT_SETTLE_SECONDS,
-        final_settle=DEFAULT_FINAL_SETTLE,
-    )
-    coordinator._previous_schedule_states = None
-    coordinator._previous_presence_state = None
-    coordinator._previous_outdoor_temp_state = None
-    coordinator._force_update = False
-    return coordinator
+from tests.conftest import DummyHass, make_coordinator
 
 
 def snapshot(
@@ -81,7 +60,7 @@ def snapshot(
 
 def test_force_update_flag():
     """Force update should apply control but NOT reset history (to avoid UI delays)."""
-    coordinator = make_coordinator()
+    coordinator = make_coordinator(DummyHass())
     coordinator._force_update = True
     result = coordinator._detect_state_transitions(
         snapshot(anyone_home=True, schedule_states={})
@@ -94,7 +73,7 @@ def test_force_update_flag():
 
 def test_first_run_triggers_update():
     """First run should apply control AND reset history (fresh start)."""
-    coordinator = make_coordinator()
+    coordinator = make_coordinator(DummyHass())
 
     result = coordinator._detect_state_transitions(
         snapshot(anyone_home=True, schedule_states={})
@@ -105,7 +84,7 @@ def test_first_run_triggers_update():
 
 def test_presence_change_detected():
     """Presence change should apply control AND reset history (override manual changes)."""
-    coordinator = make_coordinator()
+    coordinator = make_coordinator(DummyHass())
     # Previous state: (is_active, hvac_mode, target_temp, target_fan)
     coordinator._previous_schedule_states = {"morning": (False, "heat", 20.0, "auto")}
     coordinator._previous_presence_state = False
@@ -119,7 +98,7 @@ def test_presence_change_detected():
 
 def test_schedule_activation_detected():
     """Schedule activation should apply control AND reset history (override manual changes)."""
-    coordinator = make_coordinator()
+    coordinator = make_coordinator(DummyHass())
     # Previous state: (is_active, hvac_mode, target_temp, target_fan)
     coordinator._previous_schedule_states = {"morning": (False, "heat", 20.0, "auto")}
     coordinator._previous_presence_state = True
@@ -133,7 +112,7 @@ def test_schedule_activation_detected():
 
 def test_schedule_removed_detected():
     """Schedule removal should apply control AND reset history (override manual changes)."""
-    coordinator = make_coordinator()
+    coordinator = make_coordinator(DummyHass())
     # Previous state: (is_active, hvac_mode, target_temp, target_fan)
     coordinator._previous_schedule_states = {"morning": (True, "heat", 20.0, "auto")}
     coordinator._previous_presence_state = True
@@ -147,7 +126,7 @@ def test_schedule_removed_detected():
 
 def test_no_changes_returns_false():
     """No changes should not apply control and not reset history."""
-    coordinator = make_coordinator()
+    coordinator = make_coordinator(DummyHass())
     # Previous state: (is_active, hvac_mode, target_temp, target_fan)
     coordinator._previous_schedule_states = {"morning": (False, "heat", 20.0, "auto")}
     coordinator._previous_presence_state = False
@@ -161,7 +140,7 @@ def test_no_changes_returns_false():
 
 def test_temperature_change_detected():
     """Test that temperature change triggers state transition for active schedules."""
-    coordinator = make_coordinator()
+    coordinator = make_coordinator(DummyHass())
     # Previous state: active schedule with temp=20.0
     coordinator._previous_schedule_states = {"morning": (True, "heat", 20.0, "auto")}
     coordinator._previous_presence_state = True
@@ -216,7 +195,7 @@ def test_temperature_change_detected():
 
 def test_hvac_mode_change_detected():
     """Test that HVAC mode change triggers state transition for active schedules."""
-    coordinator = make_coordinator()
+    coordinator = make_coordinator(DummyHass())
     # Previous state: active schedule with heat mode
     coordinator._previous_schedule_states = {"morning": (True, "heat", 20.0, "auto")}
     coordinator._previous_presence_state = True
@@ -271,7 +250,7 @@ def test_hvac_mode_change_detected():
 
 def test_inactive_schedule_settings_change_ignored():
     """Test that settings changes are ignored for inactive schedules."""
-    coordinator = make_coordinator()
+    coordinator = make_coordinator(DummyHass())
     # Previous state: inactive schedule with temp=20.0
     coordinator._previous_schedule_states = {"morning": (False, "heat", 20.0, "auto")}
     coordinator._previous_presence_state = True
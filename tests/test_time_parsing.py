@@ -46,6 +46,8 @@ def test_parse_valid_time(time_str: str, expected: int):
         None,  # None value (will raise AttributeError)
         123,  # Integer instead of string
         "12:30 PM",  # 12-hour format with AM/PM
+        "ab:30",  # Non-numeric hour in canonical HH:MM shape
+        "-1:30",  # Negative hour in canonical HH:MM shape
     ],
 )
 def test_parse_invalid_time_returns_default(invalid_time):
@@ -83,3 +85,14 @@ def test_parse_time_result_in_range():
     for time_str in valid_times:
         result = _parse_time_to_minutes(time_str, logger)
         assert 0 <= result < MINUTES_PER_DAY
+
+
+def test_parse_time_warns_on_every_invalid_call(caplog):
+    """Memoization must not swallow warnings for repeated invalid input."""
+    logger = logging.getLogger("test")
+
+    with caplog.at_level(logging.WARNING, logger="test"):
+        assert _parse_time_to_minutes("25:00", logger) == 0
+        assert _parse_time_to_minutes("25:00", logger) == 0
+
+    assert len(caplog.records) == 2